@@ -62,6 +62,11 @@ def main():
         action="store_true",
         help="Generate HTML coverage report"
     )
+    parser.add_argument(
+        "--benchmark-save",
+        action="store_true",
+        help="Save benchmark results to .benchmarks for later comparison"
+    )
 
     args = parser.parse_args()
 
@@ -93,13 +98,20 @@ def main():
         if args.html_report:
             cmd.append("--cov-report=html:htmlcov")
 
+    # Save benchmark runs so they can be compared across branches
+    if args.benchmark_save:
+        cmd.extend([
+            "--benchmark-storage=file://.benchmarks",
+            "--benchmark-autosave"
+        ])
+
     # Add verbose output
     if args.verbose:
         cmd.append("-v")
 
     # Add parallel execution
     if args.parallel > 1:
-        cmd.extend(["-n", str(args.parallel)])
+        cmd.extend(["-n", str(args.parallel), "--dist=loadgroup"])
 
     # Add test directory
     cmd.append("tests/")
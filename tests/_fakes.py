@@ -0,0 +1,103 @@
+"""Lightweight stand-ins and patch helpers for handler tests.
+
+``MagicMock(spec=CallbackQuery)`` introspects the whole telegram class on every
+construction; these fakes only carry what the handlers actually touch.
+"""
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from vechnost_bot.models import ContentType, Language, Theme
+
+
+class FakeQuery:
+    """Callback query that records every ``edit_message_text`` call.
+
+    Photo sends are recorded on ``edit_message_media`` and ``message.reply_photo``.
+    """
+
+    def __init__(self, chat_id: int = 12345):
+        self.calls = []
+        self.edit_message_media = async_recorder()
+        self.message = SimpleNamespace(chat=SimpleNamespace(id=chat_id), reply_photo=async_recorder())
+
+    async def edit_message_text(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+
+
+def make_update(chat_id: int = 12345, text: str = "/start", username: str = "testuser", **overrides):
+    """Update stand-in for a private-chat text message; ``overrides`` replace top-level fields."""
+    chat = SimpleNamespace(id=chat_id)
+    user = SimpleNamespace(id=chat_id, username=username, first_name=None, last_name=None)
+    update = SimpleNamespace(
+        message=SimpleNamespace(
+            chat=chat,
+            from_user=user,
+            text=text,
+            reply_text=AsyncMock(),
+            reply_photo=AsyncMock(),
+        ),
+        effective_chat=chat,
+        effective_user=user,
+        callback_query=None,
+    )
+    for name, value in overrides.items():
+        setattr(update, name, value)
+    return update
+
+
+def make_callback_query(data: str | None = "test_callback", chat_id: int = 12345):
+    """Callback query stand-in whose awaited methods are ``AsyncMock``s."""
+    return SimpleNamespace(
+        data=data,
+        message=SimpleNamespace(chat=SimpleNamespace(id=chat_id)),
+        answer=AsyncMock(),
+        edit_message_text=AsyncMock(),
+    )
+
+
+def make_context(*args: str):
+    """Handler context stand-in carrying command ``args``."""
+    return SimpleNamespace(bot=MagicMock(), args=list(args) or None)
+
+
+def make_session(**overrides):
+    """Session stand-in on the acquaintance/level-1 question flow, with ``overrides`` applied."""
+    session = SimpleNamespace(
+        language=Language.ENGLISH,
+        theme=Theme.ACQUAINTANCE,
+        level=1,
+        content_type=ContentType.QUESTIONS,
+    )
+    for name, value in overrides.items():
+        setattr(session, name, value)
+    return session
+
+
+@contextmanager
+def swap(obj, name, value):
+    """Temporarily replace ``obj.name`` with ``value`` — a bare-bones ``patch.object``.
+
+    An attribute ``obj`` only inherited is deleted again on exit rather than
+    copied onto the instance, so later class-level patches still apply.
+    """
+    own = vars(obj) if hasattr(obj, "__dict__") else {}
+    had_own, original = name in own, own.get(name)
+    setattr(obj, name, value)
+    try:
+        yield value
+    finally:
+        if had_own:
+            setattr(obj, name, original)
+        else:
+            delattr(obj, name)
+
+
+def async_recorder():
+    """Return a no-op coroutine function that records its calls in ``.calls``."""
+    async def recorder(*args, **kwargs):
+        recorder.calls.append((args, kwargs))
+
+    recorder.calls = []
+    return recorder
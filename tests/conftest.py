@@ -1,6 +1,5 @@
 """Comprehensive test fixtures for Vechnost bot."""
 
-import asyncio
 import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -9,25 +8,47 @@ import json
 import tempfile
 import os
 from pathlib import Path
+from types import SimpleNamespace
 
+from redis.exceptions import ConnectionError as RedisConnectionError
 from telegram import Update, CallbackQuery, Message, User, Chat
+from telegram.error import TelegramError
 from telegram.ext import ContextTypes
 
+from vechnost_bot.callback_handlers import (
+    BackHandler,
+    CalendarHandler,
+    LanguageBackHandler,
+    LanguageHandler,
+    LevelHandler,
+    NavigationHandler,
+    QuestionHandler,
+    SimpleActionHandler,
+    ThemeHandler,
+    ToggleHandler,
+)
+from vechnost_bot.logic import load_game_data
 from vechnost_bot.models import SessionState, Language, Theme, ContentType
 from vechnost_bot.exceptions import VechnostBotError, ErrorCodes
+from vechnost_bot import hybrid_storage as hybrid_storage_module
 from vechnost_bot.hybrid_storage import HybridStorage, InMemoryStorage
 
+from tests._fakes import make_session
+
+try:
+    import uvloop
+except ImportError:  # optional speedup; uvloop does not support Windows
+    uvloop = None
+
 
 # ============================================================================
 # Session-scoped fixtures
 # ============================================================================
 
-@pytest_asyncio.fixture(scope="session")
-async def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+if uvloop is not None:
+    def pytest_asyncio_loop_factories(config, item):
+        """Run the async tests on uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
 
 
 @pytest_asyncio.fixture(scope="session")
@@ -63,6 +84,77 @@ async def mock_application(mock_telegram_bot):
     return app
 
 
+# ============================================================================
+# Callback handler fixtures
+# ============================================================================
+# Handlers keep no per-call state, so one instance of each serves the session.
+
+@pytest.fixture(scope="session")
+def theme_handler():
+    """Shared ThemeHandler."""
+    return ThemeHandler()
+
+
+@pytest.fixture(scope="session")
+def level_handler():
+    """Shared LevelHandler."""
+    return LevelHandler()
+
+
+@pytest.fixture(scope="session")
+def calendar_handler():
+    """Shared CalendarHandler."""
+    return CalendarHandler()
+
+
+@pytest.fixture(scope="session")
+def question_handler():
+    """Shared QuestionHandler."""
+    return QuestionHandler()
+
+
+@pytest.fixture(scope="session")
+def navigation_handler():
+    """Shared NavigationHandler."""
+    return NavigationHandler()
+
+
+@pytest.fixture(scope="session")
+def toggle_handler():
+    """Shared ToggleHandler."""
+    return ToggleHandler()
+
+
+@pytest.fixture(scope="session")
+def back_handler():
+    """Shared BackHandler."""
+    return BackHandler()
+
+
+@pytest.fixture(scope="session")
+def language_handler():
+    """Shared LanguageHandler."""
+    return LanguageHandler()
+
+
+@pytest.fixture(scope="session")
+def language_back_handler():
+    """Shared LanguageBackHandler."""
+    return LanguageBackHandler()
+
+
+@pytest.fixture(scope="session")
+def simple_action_handler():
+    """Shared SimpleActionHandler."""
+    return SimpleActionHandler()
+
+
+@pytest.fixture
+def mock_session():
+    """Session stand-in for handler calls; see ``tests._fakes.make_session``."""
+    return make_session()
+
+
 # ============================================================================
 # Storage fixtures
 # ============================================================================
@@ -73,14 +165,32 @@ async def in_memory_storage():
     return InMemoryStorage()
 
 
-@pytest_asyncio.fixture
-async def hybrid_storage_with_memory():
-    """Hybrid storage that uses in-memory storage."""
-    storage = HybridStorage()
+@pytest.fixture(scope="class")
+def _class_hybrid_storage():
+    """One memory-backed hybrid storage per test class."""
+    return HybridStorage()
+
+
+@pytest.fixture
+def hybrid_storage_with_memory(_class_hybrid_storage):
+    """Hybrid storage that uses in-memory storage, emptied after each test."""
+    storage = _class_hybrid_storage
     # Force use of memory storage
     storage._redis_available = False
     storage._redis_checked = True
-    return storage
+    yield storage
+    storage.memory_storage.clear()
+
+
+@pytest.fixture
+def isolated_storage(monkeypatch, hybrid_storage_with_memory):
+    """Route the process-wide session storage to ``hybrid_storage_with_memory``.
+
+    Without it the first session lookup tries to auto-start a local Redis,
+    which is slow and races on the port when tests run under pytest-xdist.
+    """
+    monkeypatch.setattr(hybrid_storage_module, "hybrid_storage", hybrid_storage_with_memory)
+    return hybrid_storage_with_memory
 
 
 @pytest_asyncio.fixture
@@ -108,77 +218,118 @@ async def mock_redis_storage():
 # Telegram API fixtures
 # ============================================================================
 
-@pytest_asyncio.fixture
-def mock_user():
+@pytest.fixture(scope="session")
+def _telegram_mocks():
+    """Spec'd Telegram mocks built once, paired with their default attributes.
+
+    ``MagicMock(spec_set=...)`` introspects the whole telegram class on construction,
+    so the mocks are shared across the session and reset per test instead. ``spec_set``
+    also rejects assignments to attributes the real class doesn't have.
+    """
+    user = MagicMock(spec_set=User)
+    chat = MagicMock(spec_set=Chat)
+    message = MagicMock(spec_set=Message)
+    callback_query = MagicMock(spec_set=CallbackQuery)
+    update = MagicMock(spec_set=Update)
+    context = MagicMock(spec_set=ContextTypes.DEFAULT_TYPE)
+    defaults = [
+        (user, {
+            "id": 12345,
+            "username": "testuser",
+            "first_name": "Test",
+            "last_name": "User",
+            "language_code": "en",
+        }),
+        (chat, {"id": 12345, "type": "private"}),
+        (message, {
+            "message_id": 1,
+            "from_user": user,
+            "chat": chat,
+            "text": "Hello",
+            "reply_text": AsyncMock(),
+            "reply_photo": AsyncMock(),
+            "edit_text": AsyncMock(),
+            "delete": AsyncMock(),
+        }),
+        (callback_query, {
+            "id": "callback_123",
+            "from_user": user,
+            "message": message,
+            "data": "theme_Acquaintance",
+            "answer": AsyncMock(),
+            "edit_message_text": AsyncMock(),
+            "edit_message_reply_markup": AsyncMock(),
+        }),
+        (update, {
+            "update_id": 1,
+            "message": message,
+            "callback_query": callback_query,
+            "effective_user": user,
+            "effective_chat": chat,
+        }),
+        (context, {"bot": MagicMock(), "args": None}),
+    ]
+    mocks = SimpleNamespace(
+        user=user,
+        chat=chat,
+        message=message,
+        callback_query=callback_query,
+        update=update,
+        context=context,
+    )
+    return mocks, defaults
+
+
+@pytest.fixture
+def _fresh_telegram_mocks(_telegram_mocks):
+    """Reset the shared Telegram mocks and restore their default attributes."""
+    mocks, defaults = _telegram_mocks
+    for mock, attrs in defaults:
+        mock.reset_mock(return_value=True, side_effect=True)
+        for value in attrs.values():
+            if isinstance(value, (AsyncMock, MagicMock)):
+                value.reset_mock(return_value=True, side_effect=True)
+        mock.configure_mock(**attrs)
+    mocks.context.bot_data = {}
+    mocks.context.user_data = {}
+    mocks.context.chat_data = {}
+    return mocks
+
+
+@pytest.fixture
+def mock_user(_fresh_telegram_mocks):
     """Mock Telegram user."""
-    user = MagicMock(spec=User)
-    user.id = 12345
-    user.username = "testuser"
-    user.first_name = "Test"
-    user.last_name = "User"
-    user.language_code = "en"
-    return user
+    return _fresh_telegram_mocks.user
 
 
-@pytest_asyncio.fixture
-def mock_chat():
+@pytest.fixture
+def mock_chat(_fresh_telegram_mocks):
     """Mock Telegram chat."""
-    chat = MagicMock(spec=Chat)
-    chat.id = 12345
-    chat.type = "private"
-    return chat
+    return _fresh_telegram_mocks.chat
 
 
-@pytest_asyncio.fixture
-def mock_message(mock_user, mock_chat):
+@pytest.fixture
+def mock_message(_fresh_telegram_mocks):
     """Mock Telegram message."""
-    message = MagicMock(spec=Message)
-    message.message_id = 1
-    message.from_user = mock_user
-    message.chat = mock_chat
-    message.text = "Hello"
-    message.reply_text = AsyncMock()
-    message.reply_photo = AsyncMock()
-    message.edit_text = AsyncMock()
-    message.delete = AsyncMock()
-    return message
+    return _fresh_telegram_mocks.message
 
 
-@pytest_asyncio.fixture
-def mock_callback_query(mock_user, mock_chat, mock_message):
+@pytest.fixture
+def mock_callback_query(_fresh_telegram_mocks):
     """Mock Telegram callback query."""
-    callback_query = MagicMock(spec=CallbackQuery)
-    callback_query.id = "callback_123"
-    callback_query.from_user = mock_user
-    callback_query.message = mock_message
-    callback_query.data = "theme_Acquaintance"
-    callback_query.answer = AsyncMock()
-    callback_query.edit_message_text = AsyncMock()
-    callback_query.edit_message_reply_markup = AsyncMock()
-    return callback_query
+    return _fresh_telegram_mocks.callback_query
 
 
-@pytest_asyncio.fixture
-def mock_update(mock_message, mock_callback_query):
+@pytest.fixture
+def mock_update(_fresh_telegram_mocks):
     """Mock Telegram update."""
-    update = MagicMock(spec=Update)
-    update.update_id = 1
-    update.message = mock_message
-    update.callback_query = mock_callback_query
-    update.effective_user = mock_message.from_user
-    update.effective_chat = mock_message.chat
-    return update
+    return _fresh_telegram_mocks.update
 
 
-@pytest_asyncio.fixture
-def mock_context():
+@pytest.fixture
+def mock_context(_fresh_telegram_mocks):
     """Mock Telegram context."""
-    context = MagicMock(spec=ContextTypes.DEFAULT_TYPE)
-    context.bot = MagicMock()
-    context.bot_data = {}
-    context.user_data = {}
-    context.chat_data = {}
-    return context
+    return _fresh_telegram_mocks.context
 
 
 # ============================================================================
@@ -288,9 +439,15 @@ def mock_game_data():
     }
 
 
-@pytest_asyncio.fixture
+@pytest.fixture(scope="session")
+def game_data():
+    """Game data loaded from the bundled YAML, once per session."""
+    return load_game_data()
+
+
+@pytest.fixture(scope="session")
 def mock_translations():
-    """Mock translations data."""
+    """Mock translations data (read-only, shared across the session)."""
     return {
         "ru": {
             "themes": {
@@ -439,14 +596,12 @@ def mock_network_error():
 @pytest_asyncio.fixture
 def mock_redis_error():
     """Mock Redis error."""
-    from redis.exceptions import ConnectionError as RedisConnectionError
     return RedisConnectionError("Error 22 connecting to localhost:6379")
 
 
 @pytest_asyncio.fixture
 def mock_telegram_error():
     """Mock Telegram API error."""
-    from telegram.error import TelegramError
     return TelegramError("Telegram API error")
 
 
@@ -466,14 +621,6 @@ def mock_validation_error():
 # Performance testing fixtures
 # ============================================================================
 
-@pytest_asyncio.fixture
-def performance_timer():
-    """Timer for performance testing."""
-    import time
-    start_time = time.time()
-    yield lambda: time.time() - start_time
-
-
 @pytest_asyncio.fixture
 def mock_high_load():
     """Mock high load scenario."""
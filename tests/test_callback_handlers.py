@@ -3,6 +3,7 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from vechnost_bot import callback_handlers as _ch
 from vechnost_bot.callback_handlers import (
     BackHandler,
     CalendarHandler,
@@ -70,7 +71,7 @@ class TestThemeHandler:
             theme_name="Sex"
         )
 
-        with patch('vechnost_bot.callback_handlers.localized_game_data') as mock_game_data:
+        with patch.object(_ch, 'localized_game_data') as mock_game_data:
             mock_game_data.has_nsfw_content.return_value = False
 
             with patch.object(handler, '_show_calendar') as mock_show_calendar:
@@ -226,13 +227,13 @@ class TestQuestionHandler:
             index=5
         )
 
-        with patch('vechnost_bot.callback_handlers.localized_game_data') as mock_game_data:
+        with patch.object(_ch, 'localized_game_data') as mock_game_data:
             mock_game_data.get_content.return_value = ["q1", "q2", "q3", "q4", "q5", "q6"]
 
-            with patch('vechnost_bot.callback_handlers.get_background_path') as mock_bg_path:
+            with patch.object(_ch, 'get_background_path') as mock_bg_path:
                 mock_bg_path.return_value = "test_bg.png"
 
-                with patch('vechnost_bot.callback_handlers.render_card') as mock_render:
+                with patch.object(_ch, 'render_card') as mock_render:
                     mock_render.return_value = MagicMock()
 
                     await handler.handle(mock_query, callback_data, session)
@@ -265,7 +266,7 @@ class TestQuestionHandler:
             index=10
         )
 
-        with patch('vechnost_bot.callback_handlers.localized_game_data') as mock_game_data:
+        with patch.object(_ch, 'localized_game_data') as mock_game_data:
             mock_game_data.get_content.return_value = ["q1", "q2", "q3"]
 
             await handler.handle(mock_query, callback_data, session)
@@ -455,7 +456,7 @@ class TestSimpleActionHandler:
             action=CallbackAction.RESET_CONFIRM
         )
 
-        with patch('vechnost_bot.callback_handlers.reset_session') as mock_reset:
+        with patch.object(_ch, 'reset_session') as mock_reset:
             await handler.handle(mock_query, callback_data, session)
 
             mock_reset.assert_called_once_with(12345)
@@ -482,6 +483,10 @@ class TestCallbackHandlerRegistry:
     def registry(self):
         return CallbackHandlerRegistry()
 
+    @pytest.fixture
+    def theme_handler(self, registry):
+        return registry._handlers[CallbackAction.THEME]
+
     @pytest.fixture
     def mock_query(self):
         query = MagicMock()
@@ -492,13 +497,13 @@ class TestCallbackHandlerRegistry:
         return query
 
     @pytest.mark.asyncio
-    async def test_handle_callback_theme(self, registry, mock_query):
+    async def test_handle_callback_theme(self, registry, theme_handler, mock_query):
         """Test handling theme callback through registry."""
-        with patch('vechnost_bot.callback_handlers.get_session') as mock_get_session:
+        with patch.object(_ch, 'get_session') as mock_get_session:
             mock_session = SessionState()
             mock_get_session.return_value = mock_session
 
-            with patch.object(registry._handlers[CallbackAction.THEME], 'handle') as mock_handle:
+            with patch.object(theme_handler, 'handle') as mock_handle:
                 await registry.handle_callback(mock_query, "theme_Acquaintance")
 
                 mock_handle.assert_called_once()
@@ -513,7 +518,7 @@ class TestCallbackHandlerRegistry:
     @pytest.mark.asyncio
     async def test_handle_callback_exception(self, registry, mock_query):
         """Test handling callback with exception through registry."""
-        with patch('vechnost_bot.callback_handlers.get_session') as mock_get_session:
+        with patch.object(_ch, 'get_session') as mock_get_session:
             mock_get_session.side_effect = Exception("Test error")
 
             await registry.handle_callback(mock_query, "theme_Acquaintance")
@@ -1,23 +1,13 @@
 """Comprehensive tests for callback handlers."""
 
+from io import BytesIO
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import MagicMock, patch, AsyncMock
-from telegram import Update, Message, Chat, User, CallbackQuery
-
-from vechnost_bot.callback_handlers import (
-    CallbackHandlerRegistry,
-    ThemeHandler,
-    LevelHandler,
-    CalendarHandler,
-    QuestionHandler,
-    NavigationHandler,
-    ToggleHandler,
-    BackHandler,
-    LanguageHandler,
-    LanguageConfirmHandler,
-    LanguageBackHandler,
-    SimpleActionHandler
-)
+from unittest.mock import AsyncMock, MagicMock
+
+import vechnost_bot.callback_handlers as ch
+from vechnost_bot.callback_handlers import CallbackHandlerRegistry
 from vechnost_bot.callback_models import (
     CallbackData,
     ThemeCallbackData,
@@ -33,469 +23,228 @@ from vechnost_bot.callback_models import (
     SimpleCallbackData,
     CallbackAction
 )
-from vechnost_bot.models import SessionState, Theme, Language, ContentType
+from vechnost_bot.models import Theme, Language, ContentType
 from vechnost_bot.i18n import get_text
 
+from tests._fakes import FakeQuery, async_recorder, make_session, swap
+
+# Callback payloads are immutable value objects; build each one once.
+CD_THEME_ACQ = ThemeCallbackData(raw_data="theme_Acquaintance", theme_name="Acquaintance")
+CD_THEME_SEX = ThemeCallbackData(raw_data="theme_Sex", theme_name="Sex")
+CD_LEVEL_1 = LevelCallbackData(raw_data="level_1", level=1)
+CD_CALENDAR_ACQ = CalendarCallbackData(
+    raw_data="cal:acq:1:q:0", topic="acq", level_or_0=1, category="q", page=0
+)
+CD_QUESTION_ACQ = QuestionCallbackData(raw_data="q:acq:1:0", topic="acq", level_or_0=1, index=0)
+CD_NAV_ACQ = NavigationCallbackData(raw_data="nav:acq:1:1", topic="acq", level_or_0=1, index=1)
+CD_TOGGLE_SEX_TASKS = ToggleCallbackData(raw_data="toggle:sex:0:t", topic="sex", category="t", page=0)
+CD_BACK_THEMES = BackCallbackData(raw_data="back:themes", destination="themes")
+CD_BACK_CALENDAR = BackCallbackData(raw_data="back:calendar", destination="calendar")
+CD_LANG_EN = LanguageCallbackData(raw_data="lang_en", language_code="en")
+CD_LANG_BACK = LanguageBackCallbackData(raw_data="lang_back")
+NOOP_CD = SimpleCallbackData(action=CallbackAction.NOOP, raw_data="noop")
+NSFW_CONFIRM_CD = SimpleCallbackData(action=CallbackAction.NSFW_CONFIRM, raw_data="nsfw_confirm")
+NSFW_DENY_CD = SimpleCallbackData(action=CallbackAction.NSFW_DENY, raw_data="nsfw_deny")
+RESET_GAME_CD = SimpleCallbackData(action=CallbackAction.RESET_GAME, raw_data="reset_game")
+RESET_CONFIRM_CD = SimpleCallbackData(action=CallbackAction.RESET_CONFIRM, raw_data="reset_confirm")
+RESET_CANCEL_CD = SimpleCallbackData(action=CallbackAction.RESET_CANCEL, raw_data="reset_cancel")
+
+# Keep the module on one xdist worker under ``-n auto --dist=loadgroup``.
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.xdist_group("callback_handlers"),
+]
+
+
+@pytest.fixture
+def mock_query():
+    """Create fake callback query."""
+    return FakeQuery()
+
 
 class TestCallbackHandlerRegistry:
     """Test callback handler registry."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def registry(self):
-        """Create callback handler registry."""
+        """Shared callback handler registry; tests patch its collaborators, not it."""
         return CallbackHandlerRegistry()
 
-    @pytest.fixture
-    def mock_query(self):
-        """Create mock callback query."""
-        query = MagicMock(spec=CallbackQuery)
-        query.message = MagicMock(spec=Message)
-        query.message.chat = MagicMock(spec=Chat)
-        query.message.chat.id = 12345
-        query.edit_message_text = AsyncMock()
-        return query
-
-    @pytest.fixture
-    def mock_session(self):
-        """Create mock session."""
-        session = MagicMock(spec=SessionState)
-        session.language = Language.ENGLISH
-        session.theme = Theme.ACQUAINTANCE
-        session.level = 1
-        session.content_type = ContentType.QUESTIONS
-        return session
-
-    @pytest.mark.asyncio
-    async def test_handle_callback_success(self, registry, mock_query, mock_session):
+    async def test_handle_callback_success(self, registry, mock_query, mock_session, monkeypatch):
         """Test successful callback handling."""
-        with patch('vechnost_bot.callback_handlers.get_session') as mock_get_session, \
-             patch('vechnost_bot.callback_handlers.CallbackData.parse') as mock_parse:
+        mock_parse = MagicMock(return_value=CD_THEME_ACQ)
+        monkeypatch.setattr(ch, "get_session", AsyncMock(return_value=mock_session))
+        monkeypatch.setattr(ch.CallbackData, "parse", mock_parse)
 
-            mock_get_session.return_value = mock_session
-            mock_callback_data = MagicMock()
-            mock_callback_data.action = CallbackAction.THEME
-            mock_parse.return_value = mock_callback_data
+        await registry.handle_callback(mock_query, "theme_Acquaintance")
 
-            await registry.handle_callback(mock_query, "theme_Acquaintance")
+        mock_parse.assert_called_once_with("theme_Acquaintance")
+        assert len(mock_query.calls) == 1
 
-            mock_parse.assert_called_once_with("theme_Acquaintance")
-
-    @pytest.mark.asyncio
-    async def test_handle_callback_invalid_data(self, registry, mock_query):
+    async def test_handle_callback_invalid_data(self, registry, mock_query, monkeypatch):
         """Test callback handling with invalid data."""
-        with patch('vechnost_bot.callback_handlers.get_session') as mock_get_session, \
-             patch('vechnost_bot.callback_handlers.CallbackData.parse') as mock_parse, \
-             patch('vechnost_bot.callback_handlers.get_text') as mock_get_text:
-
-            mock_session = MagicMock(spec=SessionState)
-            mock_session.language = Language.ENGLISH
-            mock_get_session.return_value = mock_session
-            mock_parse.side_effect = ValueError("Invalid data")
-            mock_get_text.return_value = "Unknown command"
+        monkeypatch.setattr(
+            ch, "get_session", AsyncMock(return_value=SimpleNamespace(language=Language.ENGLISH))
+        )
+        monkeypatch.setattr(ch.CallbackData, "parse", MagicMock(side_effect=ValueError("Invalid data")))
+        monkeypatch.setattr(ch, "get_text", MagicMock(return_value="Unknown command"))
 
-            await registry.handle_callback(mock_query, "invalid_data")
+        await registry.handle_callback(mock_query, "invalid_data")
 
-            mock_query.edit_message_text.assert_called_once()
+        assert len(mock_query.calls) == 1
 
-    @pytest.mark.asyncio
-    async def test_handle_callback_no_handler(self, registry, mock_query, mock_session):
+    async def test_handle_callback_no_handler(self, registry, mock_query, mock_session, monkeypatch):
         """Test callback handling with no handler."""
-        with patch('vechnost_bot.callback_handlers.get_session') as mock_get_session, \
-             patch('vechnost_bot.callback_handlers.CallbackData.parse') as mock_parse, \
-             patch('vechnost_bot.callback_handlers.get_text') as mock_get_text:
-
-            mock_get_session.return_value = mock_session
-            mock_callback_data = MagicMock()
-            mock_callback_data.action = "unknown_action"
-            mock_parse.return_value = mock_callback_data
-            mock_get_text.return_value = "Unknown command"
+        monkeypatch.setattr(ch, "get_session", AsyncMock(return_value=mock_session))
+        monkeypatch.setattr(
+            ch.CallbackData, "parse", MagicMock(return_value=MagicMock(action="unknown_action"))
+        )
+        monkeypatch.setattr(ch, "get_text", MagicMock(return_value="Unknown command"))
 
-            await registry.handle_callback(mock_query, "unknown_action")
+        await registry.handle_callback(mock_query, "unknown_action")
 
-            mock_query.edit_message_text.assert_called_once()
+        assert len(mock_query.calls) == 1
 
 
 class TestThemeHandler:
     """Test theme handler."""
 
-    @pytest.fixture
-    def handler(self):
-        """Create theme handler."""
-        return ThemeHandler()
-
-    @pytest.fixture
-    def mock_query(self):
-        """Create mock callback query."""
-        query = MagicMock(spec=CallbackQuery)
-        query.edit_message_text = AsyncMock()
-        return query
-
     @pytest.fixture
     def mock_session(self):
-        """Create mock session."""
-        session = MagicMock(spec=SessionState)
-        session.language = Language.ENGLISH
-        return session
+        """Create session stand-in."""
+        return make_session(is_nsfw_confirmed=True)
 
-    @pytest.mark.asyncio
-    async def test_handle_acquaintance_theme(self, handler, mock_query, mock_session):
+    async def test_handle_acquaintance_theme(self, theme_handler, mock_query, mock_session):
         """Test handling Acquaintance theme."""
-        callback_data = ThemeCallbackData(
-            action=CallbackAction.THEME,
-            raw_data="theme_Acquaintance",
-            theme="Acquaintance"
-        )
+        with swap(theme_handler, "_show_level_selection", async_recorder()) as mock_show_level:
+            await theme_handler.handle(mock_query, CD_THEME_ACQ, mock_session)
 
-        with patch('vechnost_bot.callback_handlers._show_level_selection') as mock_show_level:
-            await handler.handle(mock_query, callback_data, mock_session)
+            assert len(mock_show_level.calls) == 1
 
-            mock_show_level.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_handle_sex_theme(self, handler, mock_query, mock_session):
+    async def test_handle_sex_theme(self, theme_handler, mock_query, mock_session):
         """Test handling Sex theme."""
-        callback_data = ThemeCallbackData(
-            action=CallbackAction.THEME,
-            raw_data="theme_Sex",
-            theme="Sex"
-        )
+        with swap(theme_handler, "_show_calendar", async_recorder()) as mock_show_calendar:
+            await theme_handler.handle(mock_query, CD_THEME_SEX, mock_session)
 
-        with patch('vechnost_bot.callback_handlers._show_calendar') as mock_show_calendar:
-            await handler.handle(mock_query, callback_data, mock_session)
-
-            mock_show_calendar.assert_called_once()
+            assert len(mock_show_calendar.calls) == 1
 
 
 class TestLevelHandler:
     """Test level handler."""
 
-    @pytest.fixture
-    def handler(self):
-        """Create level handler."""
-        return LevelHandler()
-
-    @pytest.fixture
-    def mock_query(self):
-        """Create mock callback query."""
-        query = MagicMock(spec=CallbackQuery)
-        query.edit_message_text = AsyncMock()
-        return query
-
-    @pytest.fixture
-    def mock_session(self):
-        """Create mock session."""
-        session = MagicMock(spec=SessionState)
-        session.language = Language.ENGLISH
-        session.theme = Theme.ACQUAINTANCE
-        return session
-
-    @pytest.mark.asyncio
-    async def test_handle_level_selection(self, handler, mock_query, mock_session):
+    async def test_handle_level_selection(self, level_handler, mock_query, mock_session):
         """Test level selection handling."""
-        callback_data = LevelCallbackData(
-            action=CallbackAction.LEVEL,
-            raw_data="level_1",
-            level=1
-        )
-
-        with patch('vechnost_bot.callback_handlers._show_calendar') as mock_show_calendar:
-            await handler.handle(mock_query, callback_data, mock_session)
+        with swap(level_handler, "_show_calendar", async_recorder()) as mock_show_calendar:
+            await level_handler.handle(mock_query, CD_LEVEL_1, mock_session)
 
             assert mock_session.level == 1
-            mock_show_calendar.assert_called_once()
+            assert len(mock_show_calendar.calls) == 1
 
 
 class TestCalendarHandler:
     """Test calendar handler."""
 
-    @pytest.fixture
-    def handler(self):
-        """Create calendar handler."""
-        return CalendarHandler()
-
-    @pytest.fixture
-    def mock_query(self):
-        """Create mock callback query."""
-        query = MagicMock(spec=CallbackQuery)
-        query.edit_message_text = AsyncMock()
-        return query
-
-    @pytest.fixture
-    def mock_session(self):
-        """Create mock session."""
-        session = MagicMock(spec=SessionState)
-        session.language = Language.ENGLISH
-        session.theme = Theme.ACQUAINTANCE
-        session.level = 1
-        session.content_type = ContentType.QUESTIONS
-        return session
-
-    @pytest.mark.asyncio
-    async def test_handle_calendar_selection(self, handler, mock_query, mock_session):
+    async def test_handle_calendar_selection(self, calendar_handler, mock_query, mock_session):
         """Test calendar selection handling."""
-        callback_data = CalendarCallbackData(
-            action=CallbackAction.CALENDAR,
-            raw_data="cal:Acquaintance:1:q:0",
-            topic="Acquaintance",
-            level=1,
-            content_type="q",
-            page=0
-        )
+        with swap(calendar_handler, "_show_calendar", async_recorder()) as mock_show_calendar:
+            await calendar_handler.handle(mock_query, CD_CALENDAR_ACQ, mock_session)
 
-        with patch('vechnost_bot.callback_handlers._show_question') as mock_show_question:
-            await handler.handle(mock_query, callback_data, mock_session)
-
-            mock_show_question.assert_called_once()
+            assert len(mock_show_calendar.calls) == 1
 
 
 class TestQuestionHandler:
     """Test question handler."""
 
-    @pytest.fixture
-    def handler(self):
-        """Create question handler."""
-        return QuestionHandler()
-
-    @pytest.fixture
-    def mock_query(self):
-        """Create mock callback query."""
-        query = MagicMock(spec=CallbackQuery)
-        query.edit_message_text = AsyncMock()
-        return query
-
-    @pytest.fixture
-    def mock_session(self):
-        """Create mock session."""
-        session = MagicMock(spec=SessionState)
-        session.language = Language.ENGLISH
-        session.theme = Theme.ACQUAINTANCE
-        session.level = 1
-        session.content_type = ContentType.QUESTIONS
-        return session
-
-    @pytest.mark.asyncio
-    async def test_handle_question_selection(self, handler, mock_query, mock_session):
+    async def test_handle_question_selection(self, question_handler, mock_query, mock_session):
         """Test question selection handling."""
-        callback_data = QuestionCallbackData(
-            action=CallbackAction.QUESTION,
-            raw_data="q:Acquaintance:1:0",
-            topic="Acquaintance",
-            level=1,
-            question_idx=0
-        )
-
-        with patch('vechnost_bot.callback_handlers._show_question') as mock_show_question:
-            await handler.handle(mock_query, callback_data, mock_session)
+        with swap(ch, "render_card", MagicMock(return_value=BytesIO(b"card"))) as mock_render_card:
+            await question_handler.handle(mock_query, CD_QUESTION_ACQ, mock_session)
 
-            mock_show_question.assert_called_once()
+            mock_render_card.assert_called_once()
+            assert len(mock_query.edit_message_media.calls) == 1
+            assert mock_query.message.reply_photo.calls == []
+            assert mock_query.calls == []
 
 
 class TestNavigationHandler:
     """Test navigation handler."""
 
-    @pytest.fixture
-    def handler(self):
-        """Create navigation handler."""
-        return NavigationHandler()
-
-    @pytest.fixture
-    def mock_query(self):
-        """Create mock callback query."""
-        query = MagicMock(spec=CallbackQuery)
-        query.edit_message_text = AsyncMock()
-        return query
-
-    @pytest.fixture
-    def mock_session(self):
-        """Create mock session."""
-        session = MagicMock(spec=SessionState)
-        session.language = Language.ENGLISH
-        session.theme = Theme.ACQUAINTANCE
-        session.level = 1
-        session.content_type = ContentType.QUESTIONS
-        return session
-
-    @pytest.mark.asyncio
-    async def test_handle_navigation(self, handler, mock_query, mock_session):
+    async def test_handle_navigation(self, navigation_handler, mock_query, mock_session):
         """Test navigation handling."""
-        callback_data = NavigationCallbackData(
-            action=CallbackAction.NAVIGATION,
-            raw_data="nav:Acquaintance:1:1",
-            topic="Acquaintance",
-            level=1,
-            question_idx=1
-        )
-
-        with patch('vechnost_bot.callback_handlers._show_question') as mock_show_question:
-            await handler.handle(mock_query, callback_data, mock_session)
+        with swap(ch, "render_card", MagicMock(return_value=BytesIO(b"card"))) as mock_render_card:
+            await navigation_handler.handle(mock_query, CD_NAV_ACQ, mock_session)
 
-            mock_show_question.assert_called_once()
+            mock_render_card.assert_called_once()
+            assert len(mock_query.edit_message_media.calls) == 1
+            assert mock_query.message.reply_photo.calls == []
+            assert mock_query.calls == []
 
 
 class TestToggleHandler:
     """Test toggle handler."""
 
-    @pytest.fixture
-    def handler(self):
-        """Create toggle handler."""
-        return ToggleHandler()
-
-    @pytest.fixture
-    def mock_query(self):
-        """Create mock callback query."""
-        query = MagicMock(spec=CallbackQuery)
-        query.edit_message_text = AsyncMock()
-        return query
-
     @pytest.fixture
     def mock_session(self):
-        """Create mock session."""
-        session = MagicMock(spec=SessionState)
-        session.language = Language.ENGLISH
-        session.theme = Theme.SEX
-        session.level = 0
-        session.content_type = ContentType.QUESTIONS
-        return session
-
-    @pytest.mark.asyncio
-    async def test_handle_toggle_questions_to_tasks(self, handler, mock_query, mock_session):
-        """Test toggle from questions to tasks."""
-        callback_data = ToggleCallbackData(
-            action=CallbackAction.TOGGLE,
-            raw_data="toggle:sex:0:t",
-            topic="sex",
-            page=0,
-            category="t"
-        )
+        """Create session stand-in."""
+        return make_session(theme=Theme.SEX, level=0)
 
-        with patch('vechnost_bot.callback_handlers._show_sex_calendar') as mock_show_calendar:
-            await handler.handle(mock_query, callback_data, mock_session)
+    async def test_handle_toggle_questions_to_tasks(self, toggle_handler, mock_query, mock_session):
+        """Test toggle from questions to tasks."""
+        with swap(toggle_handler, "_show_sex_calendar", async_recorder()) as mock_show_calendar:
+            await toggle_handler.handle(mock_query, CD_TOGGLE_SEX_TASKS, mock_session)
 
             assert mock_session.content_type == ContentType.TASKS
-            mock_show_calendar.assert_called_once()
+            assert len(mock_show_calendar.calls) == 1
 
 
 class TestBackHandler:
     """Test back handler."""
 
-    @pytest.fixture
-    def handler(self):
-        """Create back handler."""
-        return BackHandler()
-
-    @pytest.fixture
-    def mock_query(self):
-        """Create mock callback query."""
-        query = MagicMock(spec=CallbackQuery)
-        query.edit_message_text = AsyncMock()
-        return query
-
-    @pytest.fixture
-    def mock_session(self):
-        """Create mock session."""
-        session = MagicMock(spec=SessionState)
-        session.language = Language.ENGLISH
-        session.theme = Theme.ACQUAINTANCE
-        session.level = 1
-        return session
-
-    @pytest.mark.asyncio
-    async def test_handle_back_to_themes(self, handler, mock_query, mock_session):
+    async def test_handle_back_to_themes(self, back_handler, mock_query, mock_session):
         """Test back to themes."""
-        callback_data = BackCallbackData(
-            action=CallbackAction.BACK,
-            raw_data="back:themes",
-            destination="themes"
-        )
+        with swap(back_handler, "_show_theme_selection", async_recorder()) as mock_show_theme:
+            await back_handler.handle(mock_query, CD_BACK_THEMES, mock_session)
 
-        with patch('vechnost_bot.callback_handlers._show_theme_selection') as mock_show_theme:
-            await handler.handle(mock_query, callback_data, mock_session)
+            assert len(mock_show_theme.calls) == 1
 
-            mock_show_theme.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_handle_back_to_calendar(self, handler, mock_query, mock_session):
+    async def test_handle_back_to_calendar(self, back_handler, mock_query, mock_session):
         """Test back to calendar."""
-        callback_data = BackCallbackData(
-            action=CallbackAction.BACK,
-            raw_data="back:calendar",
-            destination="calendar"
-        )
+        with swap(back_handler, "_show_calendar", async_recorder()) as mock_show_calendar:
+            await back_handler.handle(mock_query, CD_BACK_CALENDAR, mock_session)
 
-        with patch('vechnost_bot.callback_handlers._show_calendar') as mock_show_calendar:
-            await handler.handle(mock_query, callback_data, mock_session)
-
-            mock_show_calendar.assert_called_once()
+            assert len(mock_show_calendar.calls) == 1
 
 
 class TestLanguageHandler:
     """Test language handler."""
 
-    @pytest.fixture
-    def handler(self):
-        """Create language handler."""
-        return LanguageHandler()
-
-    @pytest.fixture
-    def mock_query(self):
-        """Create mock callback query."""
-        query = MagicMock(spec=CallbackQuery)
-        query.edit_message_text = AsyncMock()
-        return query
-
     @pytest.fixture
     def mock_session(self):
-        """Create mock session."""
-        session = MagicMock(spec=SessionState)
-        session.language = Language.RUSSIAN
-        return session
+        """Create session stand-in."""
+        return make_session(language=Language.RUSSIAN)
 
-    @pytest.mark.asyncio
-    async def test_handle_language_selection(self, handler, mock_query, mock_session):
+    async def test_handle_language_selection(self, language_handler, mock_query, mock_session):
         """Test language selection."""
-        callback_data = LanguageCallbackData(
-            action=CallbackAction.LANGUAGE,
-            raw_data="lang_en",
-            language="en"
-        )
-
-        with patch('vechnost_bot.callback_handlers.get_text') as mock_get_text, \
-             patch('vechnost_bot.callback_handlers.get_theme_keyboard') as mock_keyboard:
-
-            mock_get_text.return_value = "Welcome"
-            mock_keyboard.return_value = MagicMock()
-
-            await handler.handle(mock_query, callback_data, mock_session)
+        with swap(ch, "get_text", MagicMock(return_value="Welcome")), \
+             swap(ch, "get_theme_keyboard", MagicMock()):
+            await language_handler.handle(mock_query, CD_LANG_EN, mock_session)
 
             assert mock_session.language == Language.ENGLISH
-            mock_query.edit_message_text.assert_called_once()
+            assert len(mock_query.calls) == 1
 
 
 class TestLanguageBackHandler:
     """Test language selection back navigation."""
 
-    @pytest.fixture
-    def handler(self):
-        """Create language back handler."""
-        return LanguageBackHandler()
-
-    @pytest.mark.asyncio
     @pytest.mark.parametrize("language", list(Language))
-    async def test_welcome_text_is_translated(self, handler, language):
+    async def test_welcome_text_is_translated(self, language_back_handler, language):
         """The back screen shows real copy, not raw translation keys."""
-        query = MagicMock(spec=CallbackQuery)
-        query.edit_message_text = AsyncMock()
-        session = MagicMock(spec=SessionState)
-        session.language = language
-
-        callback_data = LanguageBackCallbackData(
-            action=CallbackAction.LANGUAGE_BACK,
-            raw_data="lang_back"
-        )
+        query = FakeQuery()
+        session = SimpleNamespace(language=language)
 
-        await handler.handle(query, callback_data, session)
+        await language_back_handler.handle(query, CD_LANG_BACK, session)
 
-        text = query.edit_message_text.call_args.args[0]
+        text = query.calls[0][0][0]
         assert text.strip()
         # get_text() returns the key itself when the key is missing
         assert "welcome." not in text
@@ -504,97 +253,23 @@ class TestLanguageBackHandler:
 class TestSimpleActionHandler:
     """Test simple action handler."""
 
-    @pytest.fixture
-    def handler(self):
-        """Create simple action handler."""
-        return SimpleActionHandler()
-
-    @pytest.fixture
-    def mock_query(self):
-        """Create mock callback query."""
-        query = MagicMock(spec=CallbackQuery)
-        query.edit_message_text = AsyncMock()
-        return query
-
-    @pytest.fixture
-    def mock_session(self):
-        """Create mock session."""
-        session = MagicMock(spec=SessionState)
-        session.language = Language.ENGLISH
-        return session
-
-    @pytest.mark.asyncio
-    async def test_handle_nsfw_confirm(self, handler, mock_query, mock_session):
-        """Test NSFW confirmation."""
-        callback_data = SimpleCallbackData(
-            action=CallbackAction.NSFW_CONFIRM,
-            raw_data="nsfw_confirm"
-        )
-
-        with patch('vechnost_bot.callback_handlers._handle_nsfw_confirmation') as mock_handle:
-            await handler.handle(mock_query, callback_data, mock_session)
-
-            mock_handle.assert_called_once_with(mock_query, mock_session)
-
-    @pytest.mark.asyncio
-    async def test_handle_nsfw_deny(self, handler, mock_query, mock_session):
-        """Test NSFW denial."""
-        callback_data = SimpleCallbackData(
-            action=CallbackAction.NSFW_DENY,
-            raw_data="nsfw_deny"
-        )
-
-        with patch('vechnost_bot.callback_handlers._handle_nsfw_denial') as mock_handle:
-            await handler.handle(mock_query, callback_data, mock_session)
-
-            mock_handle.assert_called_once_with(mock_query, mock_session)
-
-    @pytest.mark.asyncio
-    async def test_handle_reset_game(self, handler, mock_query, mock_session):
-        """Test reset game."""
-        callback_data = SimpleCallbackData(
-            action=CallbackAction.RESET_GAME,
-            raw_data="reset_game"
-        )
-
-        with patch('vechnost_bot.callback_handlers._handle_reset_request') as mock_handle:
-            await handler.handle(mock_query, callback_data, mock_session)
-
-            mock_handle.assert_called_once_with(mock_query, mock_session)
-
-    @pytest.mark.asyncio
-    async def test_handle_reset_confirm(self, handler, mock_query, mock_session):
-        """Test reset confirmation."""
-        callback_data = SimpleCallbackData(
-            action=CallbackAction.RESET_CONFIRM,
-            raw_data="reset_confirm"
-        )
-
-        with patch('vechnost_bot.callback_handlers._handle_reset_confirmation') as mock_handle:
-            await handler.handle(mock_query, callback_data, mock_session)
-
-            mock_handle.assert_called_once_with(mock_query, mock_session)
-
-    @pytest.mark.asyncio
-    async def test_handle_reset_cancel(self, handler, mock_query, mock_session):
-        """Test reset cancellation."""
-        callback_data = SimpleCallbackData(
-            action=CallbackAction.RESET_CANCEL,
-            raw_data="reset_cancel"
-        )
-
-        with patch('vechnost_bot.callback_handlers._handle_reset_cancellation') as mock_handle:
-            await handler.handle(mock_query, callback_data, mock_session)
-
-            mock_handle.assert_called_once_with(mock_query, mock_session)
-
-    @pytest.mark.asyncio
-    async def test_handle_noop(self, handler, mock_query, mock_session):
+    @pytest.mark.parametrize("callback_data,target", [
+        (NSFW_CONFIRM_CD, "_handle_nsfw_confirmation"),
+        (NSFW_DENY_CD, "_handle_nsfw_denial"),
+        (RESET_GAME_CD, "_handle_reset_request"),
+        (RESET_CONFIRM_CD, "_handle_reset_confirmation"),
+        (RESET_CANCEL_CD, "_handle_reset_cancel"),
+    ])
+    async def test_handle_simple_action(
+        self, simple_action_handler, mock_query, mock_session, callback_data, target
+    ):
+        """Each simple action dispatches to its own handler method."""
+        with swap(simple_action_handler, target, async_recorder()) as mock_handle:
+            await simple_action_handler.handle(mock_query, callback_data, mock_session)
+
+        assert mock_handle.calls == [((mock_query, mock_session), {})]
+
+    async def test_handle_noop(self, simple_action_handler, mock_query, mock_session):
         """Test no-op action."""
-        callback_data = SimpleCallbackData(
-            action=CallbackAction.NOOP,
-            raw_data="noop"
-        )
-
         # Should not raise any exceptions
-        await handler.handle(mock_query, callback_data, mock_session)
+        await simple_action_handler.handle(mock_query, NOOP_CD, mock_session)
@@ -8,6 +8,9 @@ from vechnost_bot.callback_models import (
     CalendarCallbackData,
     CallbackAction,
     CallbackData,
+    LanguageBackCallbackData,
+    LanguageCallbackData,
+    LanguageConfirmCallbackData,
     LevelCallbackData,
     NavigationCallbackData,
     QuestionCallbackData,
@@ -108,6 +111,16 @@ class TestCallbackData:
         assert callback_data.action == CallbackAction.NSFW_CONFIRM
         assert callback_data.raw_data == data
 
+    def test_parse_language_callbacks(self):
+        """Test parsing language selection, confirmation and back callback data."""
+        assert isinstance(CallbackData.parse("lang_ru"), LanguageCallbackData)
+        assert isinstance(CallbackData.parse("lang_confirm_en"), LanguageConfirmCallbackData)
+        assert isinstance(CallbackData.parse("lang_back"), LanguageBackCallbackData)
+
+    def test_parse_reuses_cached_instance(self):
+        """Test that repeated callback data parses to the same frozen instance."""
+        assert CallbackData.parse("level_3") is CallbackData.parse("level_3")
+
     def test_parse_invalid_data(self):
         """Test parsing invalid callback data."""
         with pytest.raises(ValueError, match="Invalid callback data"):
@@ -119,6 +132,9 @@ class TestCallbackData:
         with pytest.raises(ValueError, match="Potentially malicious callback data"):
             CallbackData.parse("theme_../../../etc/passwd")
 
+        with pytest.raises(ValueError, match="Potentially malicious callback data"):
+            CallbackData.parse("theme_<b>")
+
         with pytest.raises(ValueError, match="Unknown callback action"):
             CallbackData.parse("unknown_action")
 
@@ -186,25 +202,18 @@ class TestCalendarCallbackData:
         assert callback_data.page == 1
         assert callback_data.raw_data == data
 
-    def test_parse_invalid_calendar(self):
+    @pytest.mark.parametrize("data,match", [
+        ("invalid_calendar", "Invalid calendar callback data"),
+        ("cal:acq:2:q", "Invalid calendar callback format"),
+        ("cal:acq:abc:q:1", "Invalid numeric values"),
+        ("cal:acq:2:x:1", "Invalid category"),
+        ("cal:acq:-1:q:1", "Level out of range"),
+        ("cal:acq:2:q:-1", "Page out of range"),
+    ])
+    def test_parse_invalid_calendar(self, data, match):
         """Test parsing invalid calendar data."""
-        with pytest.raises(ValueError, match="Invalid calendar callback data"):
-            CalendarCallbackData.parse("invalid_calendar")
-
-        with pytest.raises(ValueError, match="Invalid calendar callback format"):
-            CalendarCallbackData.parse("cal:acq:2:q")
-
-        with pytest.raises(ValueError, match="Invalid numeric values"):
-            CalendarCallbackData.parse("cal:acq:abc:q:1")
-
-        with pytest.raises(ValueError, match="Invalid category"):
-            CalendarCallbackData.parse("cal:acq:2:x:1")
-
-        with pytest.raises(ValueError, match="Level out of range"):
-            CalendarCallbackData.parse("cal:acq:-1:q:1")
-
-        with pytest.raises(ValueError, match="Page out of range"):
-            CalendarCallbackData.parse("cal:acq:2:q:-1")
+        with pytest.raises(ValueError, match=match):
+            CalendarCallbackData.parse(data)
 
 
 class TestQuestionCallbackData:
@@ -221,22 +230,17 @@ class TestQuestionCallbackData:
         assert callback_data.index == 10
         assert callback_data.raw_data == data
 
-    def test_parse_invalid_question(self):
+    @pytest.mark.parametrize("data,match", [
+        ("invalid_question", "Invalid question callback data"),
+        ("q:acq:1", "Invalid question callback format"),
+        ("q:acq:abc:10", "Invalid numeric values"),
+        ("q:acq:-1:10", "Level out of range"),
+        ("q:acq:1:-1", "Index out of range"),
+    ])
+    def test_parse_invalid_question(self, data, match):
         """Test parsing invalid question data."""
-        with pytest.raises(ValueError, match="Invalid question callback data"):
-            QuestionCallbackData.parse("invalid_question")
-
-        with pytest.raises(ValueError, match="Invalid question callback format"):
-            QuestionCallbackData.parse("q:acq:1")
-
-        with pytest.raises(ValueError, match="Invalid numeric values"):
-            QuestionCallbackData.parse("q:acq:abc:10")
-
-        with pytest.raises(ValueError, match="Level out of range"):
-            QuestionCallbackData.parse("q:acq:-1:10")
-
-        with pytest.raises(ValueError, match="Index out of range"):
-            QuestionCallbackData.parse("q:acq:1:-1")
+        with pytest.raises(ValueError, match=match):
+            QuestionCallbackData.parse(data)
 
 
 class TestNavigationCallbackData:
@@ -253,22 +257,17 @@ class TestNavigationCallbackData:
         assert callback_data.index == 5
         assert callback_data.raw_data == data
 
-    def test_parse_invalid_navigation(self):
+    @pytest.mark.parametrize("data,match", [
+        ("invalid_navigation", "Invalid navigation callback data"),
+        ("nav:acq:1", "Invalid navigation callback format"),
+        ("nav:acq:abc:5", "Invalid numeric values"),
+        ("nav:acq:-1:5", "Level out of range"),
+        ("nav:acq:1:-1", "Index out of range"),
+    ])
+    def test_parse_invalid_navigation(self, data, match):
         """Test parsing invalid navigation data."""
-        with pytest.raises(ValueError, match="Invalid navigation callback data"):
-            NavigationCallbackData.parse("invalid_navigation")
-
-        with pytest.raises(ValueError, match="Invalid navigation callback format"):
-            NavigationCallbackData.parse("nav:acq:1")
-
-        with pytest.raises(ValueError, match="Invalid numeric values"):
-            NavigationCallbackData.parse("nav:acq:abc:5")
-
-        with pytest.raises(ValueError, match="Level out of range"):
-            NavigationCallbackData.parse("nav:acq:-1:5")
-
-        with pytest.raises(ValueError, match="Index out of range"):
-            NavigationCallbackData.parse("nav:acq:1:-1")
+        with pytest.raises(ValueError, match=match):
+            NavigationCallbackData.parse(data)
 
 
 class TestToggleCallbackData:
@@ -285,22 +284,17 @@ class TestToggleCallbackData:
         assert callback_data.page == 0
         assert callback_data.raw_data == data
 
-    def test_parse_invalid_toggle(self):
+    @pytest.mark.parametrize("data,match", [
+        ("invalid_toggle", "Invalid toggle callback data"),
+        ("toggle:sex:q", "Invalid toggle callback format"),
+        ("toggle:sex:abc:q", "Invalid numeric values"),
+        ("toggle:sex:0:x", "Invalid category"),
+        ("toggle:sex:-1:q", "Page out of range"),
+    ])
+    def test_parse_invalid_toggle(self, data, match):
         """Test parsing invalid toggle data."""
-        with pytest.raises(ValueError, match="Invalid toggle callback data"):
-            ToggleCallbackData.parse("invalid_toggle")
-
-        with pytest.raises(ValueError, match="Invalid toggle callback format"):
-            ToggleCallbackData.parse("toggle:sex:q")
-
-        with pytest.raises(ValueError, match="invalid literal for int"):
-            ToggleCallbackData.parse("toggle:sex:abc:q")
-
-        with pytest.raises(ValueError, match="Invalid category"):
-            ToggleCallbackData.parse("toggle:sex:0:x")
-
-        with pytest.raises(ValueError, match="Page out of range"):
-            ToggleCallbackData.parse("toggle:sex:-1:q")
+        with pytest.raises(ValueError, match=match):
+            ToggleCallbackData.parse(data)
 
 
 class TestBackCallbackData:
@@ -2,8 +2,10 @@
 
 import pytest
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
+import vechnost_bot.payments.services as services
 from vechnost_bot.payments.models import Certificate, User
 from vechnost_bot.payments.repositories import CertificateRepository, UserRepository
 from vechnost_bot.payments.services import activate_certificate, user_has_access
@@ -43,222 +45,192 @@ class TestCertificateModel:
         assert "used" in repr(cert_used)
 
 
+def make_certificate():
+    """Fresh unused certificate mock; tests change what differs."""
+    cert = MagicMock(spec=Certificate)
+    cert.id = 1
+    cert.code = "VECH-TEST-1234"
+    cert.is_used = False
+    cert.used_by_telegram_user_id = None
+    cert.used_at = None
+    return cert
+
+
+@pytest.fixture
+def payment_mocks(monkeypatch):
+    """Swap the payment service's database, repositories and settings for mocks."""
+    mocks = SimpleNamespace(
+        session=AsyncMock(),
+        get_db=MagicMock(),
+        cert_repo=MagicMock(),
+        user_repo=MagicMock(),
+        sub_repo=MagicMock(),
+        pay_repo=MagicMock(),
+        settings=MagicMock(enable_payment=True),
+    )
+    mocks.get_db.return_value.__aenter__.return_value = mocks.session
+
+    monkeypatch.setattr(services, "get_db", mocks.get_db)
+    monkeypatch.setattr(services, "CertificateRepository", mocks.cert_repo)
+    monkeypatch.setattr(services, "UserRepository", mocks.user_repo)
+    monkeypatch.setattr(services, "SubscriptionRepository", mocks.sub_repo)
+    monkeypatch.setattr(services, "PaymentRepository", mocks.pay_repo)
+    monkeypatch.setattr(services, "settings", mocks.settings)
+    return mocks
+
+
 @pytest.mark.asyncio
 class TestCertificateActivation:
     """Test certificate activation logic."""
 
-    async def test_activate_certificate_success(self):
+    async def test_activate_certificate_success(self, payment_mocks):
         """Test successful certificate activation."""
-        # Mock database session and repositories
-        with patch('vechnost_bot.payments.services.get_db') as mock_get_db, \
-             patch('vechnost_bot.payments.services.CertificateRepository') as mock_cert_repo, \
-             patch('vechnost_bot.payments.services.UserRepository') as mock_user_repo:
-
-            # Setup mocks
-            mock_session = AsyncMock()
-            mock_get_db.return_value.__aenter__.return_value = mock_session
-
-            # Mock certificate
-            mock_cert = MagicMock(spec=Certificate)
-            mock_cert.id = 1
-            mock_cert.code = "VECH-TEST-1234"
-            mock_cert.is_used = False
-            mock_cert.used_by_telegram_user_id = None
-            mock_cert.used_at = None
-            mock_cert_repo.get_by_code = AsyncMock(return_value=mock_cert)
-
-            # Mock user
-            mock_user = MagicMock(spec=User)
-            mock_user.id = 1
-            mock_user.telegram_user_id = 123456789
-            mock_user_repo.create_or_update = AsyncMock(return_value=mock_user)
-
-            # Mock mark as used
-            mock_cert_repo.mark_as_used = AsyncMock(return_value=mock_cert)
-
-            # Execute
-            result = await activate_certificate(
-                code="VECH-TEST-1234",
-                telegram_user_id=123456789,
-                username="testuser",
-                first_name="Test",
-                last_name="User"
-            )
-
-            # Verify
-            assert result["status"] == "success"
-            assert result["certificate_id"] == 1
-            mock_user_repo.create_or_update.assert_called_once()
-            mock_cert_repo.mark_as_used.assert_called_once()
-            mock_session.commit.assert_called_once()
-
-    async def test_activate_certificate_not_found(self):
+        # Mock certificate
+        mock_cert = make_certificate()
+        payment_mocks.cert_repo.get_by_code = AsyncMock(return_value=mock_cert)
+
+        # Mock user
+        mock_user = MagicMock(spec=User)
+        mock_user.id = 1
+        mock_user.telegram_user_id = 123456789
+        payment_mocks.user_repo.create_or_update = AsyncMock(return_value=mock_user)
+
+        # Mock mark as used
+        payment_mocks.cert_repo.mark_as_used = AsyncMock(return_value=mock_cert)
+
+        # Execute
+        result = await activate_certificate(
+            code="VECH-TEST-1234",
+            telegram_user_id=123456789,
+            username="testuser",
+            first_name="Test",
+            last_name="User"
+        )
+
+        # Verify
+        assert result["status"] == "success"
+        assert result["certificate_id"] == 1
+        payment_mocks.user_repo.create_or_update.assert_called_once()
+        payment_mocks.cert_repo.mark_as_used.assert_called_once()
+        payment_mocks.session.commit.assert_called_once()
+
+    async def test_activate_certificate_not_found(self, payment_mocks):
         """Test activation with non-existent certificate (404)."""
-        with patch('vechnost_bot.payments.services.get_db') as mock_get_db, \
-             patch('vechnost_bot.payments.services.CertificateRepository') as mock_cert_repo:
+        payment_mocks.cert_repo.get_by_code = AsyncMock(return_value=None)
 
-            mock_session = AsyncMock()
-            mock_get_db.return_value.__aenter__.return_value = mock_session
-            mock_cert_repo.get_by_code = AsyncMock(return_value=None)
+        result = await activate_certificate(
+            code="NONEXISTENT",
+            telegram_user_id=123456789
+        )
 
-            result = await activate_certificate(
-                code="NONEXISTENT",
-                telegram_user_id=123456789
-            )
+        assert result["status"] == "error"
+        assert result["code"] == 404
+        assert "not found" in result["message"].lower()
 
-            assert result["status"] == "error"
-            assert result["code"] == 404
-            assert "not found" in result["message"].lower()
-
-    async def test_activate_certificate_already_used(self):
+    async def test_activate_certificate_already_used(self, payment_mocks):
         """Test activation of already used certificate (409) - one-time use enforcement."""
-        with patch('vechnost_bot.payments.services.get_db') as mock_get_db, \
-             patch('vechnost_bot.payments.services.CertificateRepository') as mock_cert_repo:
-
-            mock_session = AsyncMock()
-            mock_get_db.return_value.__aenter__.return_value = mock_session
-
-            # Mock already used certificate
-            mock_cert = MagicMock(spec=Certificate)
-            mock_cert.code = "VECH-TEST-1234"
-            mock_cert.is_used = True  # Already used!
-            mock_cert.used_by_telegram_user_id = 987654321  # Used by another user
-            mock_cert.used_at = datetime.utcnow()
-            mock_cert_repo.get_by_code = AsyncMock(return_value=mock_cert)
-
-            result = await activate_certificate(
-                code="VECH-TEST-1234",
-                telegram_user_id=123456789  # Different user trying to use
-            )
-
-            assert result["status"] == "error"
-            assert result["code"] == 409
-            assert "already used" in result["message"].lower()
-
-    async def test_activate_certificate_different_user_cannot_reuse(self):
+        # Mock already used certificate
+        mock_cert = make_certificate()
+        mock_cert.is_used = True  # Already used!
+        mock_cert.used_by_telegram_user_id = 987654321  # Used by another user
+        mock_cert.used_at = datetime.utcnow()
+        payment_mocks.cert_repo.get_by_code = AsyncMock(return_value=mock_cert)
+
+        result = await activate_certificate(
+            code="VECH-TEST-1234",
+            telegram_user_id=123456789  # Different user trying to use
+        )
+
+        assert result["status"] == "error"
+        assert result["code"] == 409
+        assert "already used" in result["message"].lower()
+
+    async def test_activate_certificate_different_user_cannot_reuse(self, payment_mocks):
         """Test that different user cannot reuse certificate (requirement #3)."""
-        with patch('vechnost_bot.payments.services.get_db') as mock_get_db, \
-             patch('vechnost_bot.payments.services.CertificateRepository') as mock_cert_repo:
-
-            mock_session = AsyncMock()
-            mock_get_db.return_value.__aenter__.return_value = mock_session
-
-            # Certificate already used by user 111
-            mock_cert = MagicMock(spec=Certificate)
-            mock_cert.is_used = True
-            mock_cert.used_by_telegram_user_id = 111
-            mock_cert_repo.get_by_code = AsyncMock(return_value=mock_cert)
-
-            # User 222 tries to activate
-            result = await activate_certificate(
-                code="VECH-TEST-1234",
-                telegram_user_id=222
-            )
-
-            assert result["status"] == "error"
-            assert result["code"] == 409
-
-    async def test_activate_certificate_creates_user(self):
+        # Certificate already used by user 111
+        mock_cert = make_certificate()
+        mock_cert.is_used = True
+        mock_cert.used_by_telegram_user_id = 111
+        payment_mocks.cert_repo.get_by_code = AsyncMock(return_value=mock_cert)
+
+        # User 222 tries to activate
+        result = await activate_certificate(
+            code="VECH-TEST-1234",
+            telegram_user_id=222
+        )
+
+        assert result["status"] == "error"
+        assert result["code"] == 409
+
+    async def test_activate_certificate_creates_user(self, payment_mocks):
         """Test that certificate activation creates user in database (requirement #1)."""
-        with patch('vechnost_bot.payments.services.get_db') as mock_get_db, \
-             patch('vechnost_bot.payments.services.CertificateRepository') as mock_cert_repo, \
-             patch('vechnost_bot.payments.services.UserRepository') as mock_user_repo:
-
-            mock_session = AsyncMock()
-            mock_get_db.return_value.__aenter__.return_value = mock_session
-
-            mock_cert = MagicMock(spec=Certificate)
-            mock_cert.id = 1
-            mock_cert.is_used = False
-            mock_cert_repo.get_by_code = AsyncMock(return_value=mock_cert)
-            mock_cert_repo.mark_as_used = AsyncMock(return_value=mock_cert)
-
-            mock_user = MagicMock(spec=User)
-            mock_user.id = 1
-            mock_user.telegram_user_id = 123456789
-            mock_user_repo.create_or_update = AsyncMock(return_value=mock_user)
-
-            await activate_certificate(
-                code="VECH-TEST-1234",
-                telegram_user_id=123456789,
-                username="testuser",
-                first_name="Test",
-                last_name="User"
-            )
-
-            # Verify user was created with full info
-            mock_user_repo.create_or_update.assert_called_once_with(
-                mock_session,
-                telegram_user_id=123456789,
-                username="testuser",
-                first_name="Test",
-                last_name="User"
-            )
+        mock_cert = make_certificate()
+        payment_mocks.cert_repo.get_by_code = AsyncMock(return_value=mock_cert)
+        payment_mocks.cert_repo.mark_as_used = AsyncMock(return_value=mock_cert)
+
+        mock_user = MagicMock(spec=User)
+        mock_user.id = 1
+        mock_user.telegram_user_id = 123456789
+        payment_mocks.user_repo.create_or_update = AsyncMock(return_value=mock_user)
+
+        await activate_certificate(
+            code="VECH-TEST-1234",
+            telegram_user_id=123456789,
+            username="testuser",
+            first_name="Test",
+            last_name="User"
+        )
+
+        # Verify user was created with full info
+        payment_mocks.user_repo.create_or_update.assert_called_once_with(
+            payment_mocks.session,
+            telegram_user_id=123456789,
+            username="testuser",
+            first_name="Test",
+            last_name="User"
+        )
 
 
 @pytest.mark.asyncio
 class TestUserAccess:
     """Test user access logic with certificates."""
 
-    async def test_user_has_access_with_activated_certificate(self):
+    async def test_user_has_access_with_activated_certificate(self, payment_mocks):
         """Test that user has access after activating certificate (requirement #4)."""
-        with patch('vechnost_bot.payments.services.get_db') as mock_get_db, \
-             patch('vechnost_bot.payments.services.UserRepository') as mock_user_repo, \
-             patch('vechnost_bot.payments.services.CertificateRepository') as mock_cert_repo, \
-             patch('vechnost_bot.payments.services.SubscriptionRepository') as mock_sub_repo, \
-             patch('vechnost_bot.payments.services.PaymentRepository') as mock_pay_repo, \
-             patch('vechnost_bot.payments.services.settings') as mock_settings:
-
-            mock_settings.enable_payment = True
-            mock_session = AsyncMock()
-            mock_get_db.return_value.__aenter__.return_value = mock_session
-
-            # Mock user exists
-            mock_user = MagicMock(spec=User)
-            mock_user.id = 1
-            mock_user_repo.get_by_telegram_id = AsyncMock(return_value=mock_user)
-
-            # Mock no subscriptions or payments
-            mock_sub_repo.get_active_subscriptions_for_user = AsyncMock(return_value=[])
-            mock_pay_repo.get_active_payments_for_user = AsyncMock(return_value=[])
-
-            # Mock activated certificate
-            mock_cert = MagicMock(spec=Certificate)
-            mock_cert.code = "VECH-TEST-1234"
-            mock_cert.is_used = True
-            mock_cert.used_by_telegram_user_id = 123456789
-            mock_cert_repo.get_by_user = AsyncMock(return_value=[mock_cert])
-
-            has_access = await user_has_access(123456789)
-
-            assert has_access is True
-            mock_cert_repo.get_by_user.assert_called_once_with(mock_session, 123456789)
-
-    async def test_user_no_access_without_certificate(self):
-        """Test that user has no access without certificate."""
-        with patch('vechnost_bot.payments.services.get_db') as mock_get_db, \
-             patch('vechnost_bot.payments.services.UserRepository') as mock_user_repo, \
-             patch('vechnost_bot.payments.services.CertificateRepository') as mock_cert_repo, \
-             patch('vechnost_bot.payments.services.SubscriptionRepository') as mock_sub_repo, \
-             patch('vechnost_bot.payments.services.PaymentRepository') as mock_pay_repo, \
-             patch('vechnost_bot.payments.services.settings') as mock_settings:
+        # Mock user exists
+        mock_user = MagicMock(spec=User)
+        mock_user.id = 1
+        payment_mocks.user_repo.get_by_telegram_id = AsyncMock(return_value=mock_user)
+
+        # Mock no subscriptions or payments
+        payment_mocks.sub_repo.get_active_subscriptions_for_user = AsyncMock(return_value=[])
+        payment_mocks.pay_repo.get_active_payments_for_user = AsyncMock(return_value=[])
 
-            mock_settings.enable_payment = True
-            mock_session = AsyncMock()
-            mock_get_db.return_value.__aenter__.return_value = mock_session
+        # Mock activated certificate
+        mock_cert = make_certificate()
+        mock_cert.is_used = True
+        mock_cert.used_by_telegram_user_id = 123456789
+        payment_mocks.cert_repo.get_by_user = AsyncMock(return_value=[mock_cert])
 
-            mock_user = MagicMock(spec=User)
-            mock_user.id = 1
-            mock_user_repo.get_by_telegram_id = AsyncMock(return_value=mock_user)
+        has_access = await user_has_access(123456789)
+
+        assert has_access is True
+        payment_mocks.cert_repo.get_by_user.assert_called_once_with(payment_mocks.session, 123456789)
+
+    async def test_user_no_access_without_certificate(self, payment_mocks):
+        """Test that user has no access without certificate."""
+        mock_user = MagicMock(spec=User)
+        mock_user.id = 1
+        payment_mocks.user_repo.get_by_telegram_id = AsyncMock(return_value=mock_user)
 
-            # No subscriptions, payments, or certificates
-            mock_sub_repo.get_active_subscriptions_for_user = AsyncMock(return_value=[])
-            mock_pay_repo.get_active_payments_for_user = AsyncMock(return_value=[])
-            mock_cert_repo.get_by_user = AsyncMock(return_value=[])
+        # No subscriptions, payments, or certificates
+        payment_mocks.sub_repo.get_active_subscriptions_for_user = AsyncMock(return_value=[])
+        payment_mocks.pay_repo.get_active_payments_for_user = AsyncMock(return_value=[])
+        payment_mocks.cert_repo.get_by_user = AsyncMock(return_value=[])
 
-            has_access = await user_has_access(123456789)
+        has_access = await user_has_access(123456789)
 
-            assert has_access is False
+        assert has_access is False
 
 
 @pytest.mark.asyncio
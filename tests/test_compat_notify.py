@@ -1,8 +1,7 @@
 """Tests for the compatibility-test completion push.
 
 Sync tests driving the coroutine with `asyncio.run()`, as `test_daily_card.py`
-does: the repo's session-scoped `event_loop` fixture in `tests/conftest.py`
-makes every `async def` test error out with ScopeMismatch.
+does.
 """
 
 import asyncio
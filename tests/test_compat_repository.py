@@ -1,11 +1,7 @@
 """Tests for compatibility-test persistence.
 
 These are plain synchronous test functions that call asyncio.run() around an
-inner coroutine, following tests/test_rooms.py::test_expired_room_410. This
-repo's tests/conftest.py defines a session-scoped event_loop fixture that
-conflicts with pytest-asyncio's function-scoped default, so bare async
-fixtures / async test functions error on collection with ScopeMismatch.
-Nothing here is defined at module scope as an async fixture.
+inner coroutine, following tests/test_rooms.py::test_expired_room_410.
 """
 
 import asyncio
@@ -53,10 +53,7 @@ def test_renders_in_every_language(language):
 # `send_daily_cards` imports `get_db` and `UserRepository` inside the function,
 # so both are patched where they are defined, not on `daily_card`.
 #
-# These two run the coroutine themselves instead of relying on pytest-asyncio:
-# the repo's session-scoped `event_loop` fixture in tests/conftest.py makes every
-# `async def` test error out with ScopeMismatch, and that fixture is out of scope
-# here. Driving the loop directly keeps the send path genuinely covered.
+# These two run the coroutine themselves instead of relying on pytest-asyncio.
 
 
 def _run_send(bot, recipients, repo_extra=None):
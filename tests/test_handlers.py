@@ -1,111 +1,52 @@
 """Tests for bot handlers."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
 
 from vechnost_bot.handlers import handle_callback_query, start_command
 from vechnost_bot.models import Theme
 
+from tests._fakes import make_callback_query, make_context, make_update
+
+CB_THEME = "theme_Acquaintance"
+CB_INVALID = "invalid_data"
+
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.usefixtures("isolated_storage"),
+]
+
 
 class TestHandlers:
     """Test bot handlers functionality."""
 
-    @pytest.mark.asyncio
     async def test_start_command(self):
         """Test start command handler."""
-        # Mock update and context
-        update = MagicMock()
-        update.message = MagicMock()
-        update.effective_chat = MagicMock()
-        update.effective_chat.id = 12345
-        context = MagicMock()
-
-        # Mock reply_text
-        update.message.reply_text = AsyncMock()
+        update = make_update()
 
         # Call the handler
-        await start_command(update, context)
+        await start_command(update, make_context())
 
-        # Verify reply_text was called
-        update.message.reply_text.assert_called_once()
-        args, kwargs = update.message.reply_text.call_args
+        # Verify the logo was sent with the language keyboard
+        update.message.reply_photo.assert_called_once()
+        args, kwargs = update.message.reply_photo.call_args
 
         # Check that reply_markup is present
         assert "reply_markup" in kwargs
         assert kwargs["reply_markup"] is not None
 
-    @pytest.mark.asyncio
-    async def test_callback_query_theme_selection(self):
-        """Test callback query for theme selection."""
-        # Mock update and context
-        update = MagicMock()
-        update.callback_query = MagicMock()
-        update.callback_query.data = "theme_Acquaintance"
-        update.callback_query.answer = AsyncMock()
-        update.callback_query.edit_message_text = AsyncMock()
-        update.callback_query.message = MagicMock()
-        update.callback_query.message.chat = MagicMock()
-        update.callback_query.message.chat.id = 12345
-        context = MagicMock()
-
-        # Call the handler
-        await handle_callback_query(update, context)
-
-        # Verify callback was answered
-        update.callback_query.answer.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_callback_query_invalid_data(self):
-        """Test callback query with invalid data."""
-        # Mock update and context
-        update = MagicMock()
-        update.callback_query = MagicMock()
-        update.callback_query.data = "invalid_data"
-        update.callback_query.answer = AsyncMock()
-        update.callback_query.edit_message_text = AsyncMock()
-        update.callback_query.message = MagicMock()
-        update.callback_query.message.chat = MagicMock()
-        update.callback_query.message.chat.id = 12345
-        update.effective_user = MagicMock()
-        update.effective_user.id = 12345
-        context = MagicMock()
-
-        # Call the handler
-        await handle_callback_query(update, context)
-
-        # Verify callback was answered
-        update.callback_query.answer.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_callback_query_no_data(self):
-        """Test callback query with no data."""
-        # Mock update and context
-        update = MagicMock()
-        update.callback_query = MagicMock()
-        update.callback_query.data = None
-        update.callback_query.answer = AsyncMock()
-        update.callback_query.message = MagicMock()
-        update.callback_query.message.chat = MagicMock()
-        update.callback_query.message.chat.id = 12345
-        update.effective_user = MagicMock()
-        update.effective_user.id = 12345
-        context = MagicMock()
-
-        # Call the handler
-        await handle_callback_query(update, context)
-
-        # Verify callback was answered
-        update.callback_query.answer.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_callback_query_no_query(self):
-        """Test callback query with no query object."""
-        # Mock update and context
-        update = MagicMock()
-        update.callback_query = None
-        context = MagicMock()
-
-        # Call the handler (should return early)
-        await handle_callback_query(update, context)
-
-        # Should not raise any exceptions
+    @pytest.mark.parametrize("callback_data,query_is_none", [
+        pytest.param(CB_THEME, False, id="theme_selection"),
+        pytest.param(CB_INVALID, False, id="invalid_data"),
+        pytest.param(None, False, id="no_data"),
+        pytest.param(None, True, id="no_query"),
+    ])
+    async def test_callback_query_variants(self, callback_data, query_is_none):
+        """Test callback queries with theme, invalid, missing data and no query."""
+        query = None if query_is_none else make_callback_query(callback_data)
+        update = make_update(callback_query=query)
+
+        # A missing query returns early; otherwise the callback is answered
+        await handle_callback_query(update, make_context())
+
+        if query is not None:
+            query.answer.assert_called_once()
@@ -1,10 +1,12 @@
 """Comprehensive tests for message handlers."""
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch, AsyncMock
-from telegram import Update, Message, Chat, User, CallbackQuery
-from telegram.ext import ContextTypes
 
+from vechnost_bot import handlers
+from vechnost_bot.callback_handlers import callback_registry
+from vechnost_bot.callback_models import CallbackAction
 from vechnost_bot.handlers import (
     start_command,
     help_command,
@@ -13,128 +15,129 @@ from vechnost_bot.handlers import (
     detect_language_from_text,
     generate_welcome_image_with_logo
 )
-from vechnost_bot.models import SessionState, Theme, Language
+from vechnost_bot.models import Theme, Language
 from vechnost_bot.i18n import get_text
 
+from tests._fakes import make_callback_query, make_context, make_session, make_update, swap
 
+CB_TEST = "test_callback"
+CB_NOOP = "noop"
+
+
+pytestmark = pytest.mark.usefixtures("isolated_storage")
+
+
+@pytest.fixture
+def mock_update():
+    """Create a mock update object."""
+    return make_update()
+
+
+@pytest.fixture
+def mock_context():
+    """Create a mock context object."""
+    return make_context()
+
+
+@pytest.fixture
+def mock_callback_query():
+    """Create a mock callback query."""
+    return make_callback_query(CB_TEST)
+
+
+@pytest.fixture(scope="session")
+def welcome_image_en():
+    """English welcome image, rendered once per session."""
+    image = generate_welcome_image_with_logo("Welcome", Language.ENGLISH.value)
+    yield image
+    image.close()
+
+
+@pytest.mark.asyncio(loop_scope="session")
 class TestCommandHandlers:
     """Test command handlers."""
 
-    @pytest.fixture
-    def mock_update(self):
-        """Create a mock update object."""
-        update = MagicMock(spec=Update)
-        update.message = MagicMock(spec=Message)
-        update.message.chat = MagicMock(spec=Chat)
-        update.message.chat.id = 12345
-        update.message.from_user = MagicMock(spec=User)
-        update.message.from_user.id = 12345
-        update.message.from_user.username = "testuser"
-        update.message.text = "/start"
-        return update
-
-    @pytest.fixture
-    def mock_context(self):
-        """Create a mock context object."""
-        context = MagicMock(spec=ContextTypes.DEFAULT_TYPE)
-        context.bot = MagicMock()
-        return context
-
-    @pytest.mark.asyncio
-    async def test_start_command_success(self, mock_update, mock_context):
+    @pytest.fixture(autouse=True)
+    def handlers_patches(self, monkeypatch):
+        """Stub out start_command's keyboard, language detection, logo file and monitoring."""
+        patches = SimpleNamespace(
+            keyboard=MagicMock(),
+            set_user_context=MagicMock(),
+        )
+        monkeypatch.setattr(handlers, "get_language_selection_keyboard", patches.keyboard)
+        monkeypatch.setattr(handlers, "detect_language_from_text", lambda *_: Language.ENGLISH)
+        monkeypatch.setattr(handlers, "set_user_context", patches.set_user_context)
+        monkeypatch.setattr(handlers, "open", MagicMock(), raising=False)
+        return patches
+
+    async def test_start_command_success(self, mock_update, mock_context, handlers_patches):
         """Test successful start command."""
-        with patch('vechnost_bot.handlers.get_language_selection_keyboard') as mock_keyboard, \
-             patch('vechnost_bot.handlers.detect_language_from_text') as mock_detect, \
-             patch('vechnost_bot.handlers.open') as mock_open, \
-             patch('vechnost_bot.handlers.set_user_context') as mock_set_context:
-
-            mock_detect.return_value = Language.ENGLISH
-            mock_keyboard.return_value = MagicMock()
-            mock_open.return_value.__enter__.return_value = MagicMock()
-            mock_update.message.reply_photo = AsyncMock()
+        await start_command(mock_update, mock_context)
 
-            await start_command(mock_update, mock_context)
+        handlers_patches.set_user_context.assert_called_once_with(12345, "testuser")
+        handlers_patches.keyboard.assert_called_once_with(Language.ENGLISH)
+        mock_update.message.reply_photo.assert_called_once()
 
-            mock_set_context.assert_called_once_with(12345, "testuser")
-            mock_update.message.reply_photo.assert_called_once()
-
-    @pytest.mark.asyncio
     async def test_start_command_no_message(self, mock_context):
         """Test start command with no message."""
-        update = MagicMock(spec=Update)
-        update.message = None
+        update = make_update(message=None)
 
         # Should return early without error
         await start_command(update, mock_context)
 
-    @pytest.mark.asyncio
     async def test_help_command(self, mock_update, mock_context):
         """Test help command."""
-        mock_update.message.reply_text = AsyncMock()
-
         await help_command(mock_update, mock_context)
 
         mock_update.message.reply_text.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_reset_command(self, mock_update, mock_context):
         """Test reset command."""
-        with patch('vechnost_bot.handlers.get_session') as mock_get_session, \
-             patch('vechnost_bot.handlers.get_reset_keyboard') as mock_keyboard:
+        with patch.object(handlers, 'get_session') as mock_get_session, \
+             patch.object(handlers, 'get_reset_confirmation_keyboard') as mock_keyboard:
 
-            mock_session = MagicMock(spec=SessionState)
-            mock_session.language = Language.ENGLISH
-            mock_get_session.return_value = mock_session
+            mock_get_session.return_value = make_session()
             mock_keyboard.return_value = MagicMock()
-            mock_update.message.reply_text = AsyncMock()
 
             await reset_command(mock_update, mock_context)
 
             mock_update.message.reply_text.assert_called_once()
 
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestCallbackHandlers:
     """Test callback query handlers."""
 
-    @pytest.fixture
-    def mock_callback_query(self):
-        """Create a mock callback query."""
-        query = MagicMock(spec=CallbackQuery)
-        query.message = MagicMock(spec=Message)
-        query.message.chat = MagicMock(spec=Chat)
-        query.message.chat.id = 12345
-        query.data = "test_callback"
-        return query
-
-    @pytest.fixture
-    def mock_context(self):
-        """Create a mock context object."""
-        context = MagicMock(spec=ContextTypes.DEFAULT_TYPE)
-        context.bot = MagicMock()
-        return context
-
-    @pytest.mark.asyncio
     async def test_handle_callback_query_success(self, mock_callback_query, mock_context):
-        """Test successful callback query handling."""
-        with patch('vechnost_bot.handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
+        """Test successful callback query handling end to end."""
+        update = make_update(callback_query=mock_callback_query)
 
-            await handle_callback_query(mock_callback_query, mock_context)
+        with swap(callback_registry, "handle_callback", AsyncMock()) as handle_callback:
+            await handle_callback_query(update, mock_context)
 
-            mock_registry.handle_callback.assert_called_once_with(
-                mock_callback_query, "test_callback"
-            )
+        mock_callback_query.answer.assert_called_once()
+        handle_callback.assert_called_once_with(mock_callback_query, CB_TEST)
 
-    @pytest.mark.asyncio
-    async def test_handle_callback_query_exception(self, mock_callback_query, mock_context):
-        """Test callback query handling with exception."""
-        with patch('vechnost_bot.handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback.side_effect = Exception("Test error")
-            mock_callback_query.answer = AsyncMock()
+    async def test_registry_dispatch(self, mock_callback_query):
+        """Test the registry routes parsed data to the matching handler."""
+        handler = SimpleNamespace(handle=AsyncMock())
 
-            await handle_callback_query(mock_callback_query, mock_context)
+        with patch.dict(callback_registry._handlers, {CallbackAction.NOOP: handler}):
+            await callback_registry.handle_callback(mock_callback_query, CB_NOOP)
 
-            mock_callback_query.answer.assert_called_once()
+        handler.handle.assert_called_once()
+        query, callback_data, _session = handler.handle.call_args.args
+        assert query is mock_callback_query
+        assert callback_data.action == CallbackAction.NOOP
+
+    async def test_registry_handler_exception(self, mock_callback_query):
+        """Test a failing handler is reported to the user instead of raised."""
+        handler = SimpleNamespace(handle=AsyncMock(side_effect=Exception("Test error")))
+
+        with patch.dict(callback_registry._handlers, {CallbackAction.NOOP: handler}):
+            await callback_registry.handle_callback(mock_callback_query, CB_NOOP)
+
+        mock_callback_query.edit_message_text.assert_called_once()
 
 
 # NSFW and Reset handlers are now in callback_handlers.py
@@ -143,36 +146,16 @@ class TestCallbackHandlers:
 class TestUtilityFunctions:
     """Test utility functions."""
 
-    def test_detect_language_from_text_russian(self):
-        """Test Russian language detection."""
-        text = "Привет, как дела?"
-        result = detect_language_from_text(text)
-        assert result == Language.RUSSIAN
-
-    def test_detect_language_from_text_english(self):
-        """Test English language detection."""
-        text = "Hello, how are you?"
-        result = detect_language_from_text(text)
-        assert result == Language.ENGLISH
-
-    def test_detect_language_from_text_czech(self):
-        """Test Czech language detection."""
-        text = "Ahoj, jak se máš?"
-        result = detect_language_from_text(text)
-        assert result == Language.CZECH
-
-    def test_detect_language_from_text_default(self):
-        """Test default language detection."""
-        text = "123456789"
-        result = detect_language_from_text(text)
-        assert result == Language.RUSSIAN
-
-    @patch('vechnost_bot.handlers.generate_vechnost_logo')
-    def test_generate_welcome_image_with_logo(self, mock_generate_logo):
+    @pytest.mark.parametrize("text,expected", [
+        ("Привет, как дела?", Language.RUSSIAN),
+        ("What is the plan for today?", Language.ENGLISH),
+        ("Ahoj, jak se máš?", Language.CZECH),
+        ("123456789", Language.RUSSIAN),
+    ], ids=["ru", "en", "cs", "digits"])
+    def test_detect_language(self, text, expected):
+        """Test language detection, defaulting to Russian."""
+        assert detect_language_from_text(text) == expected
+
+    def test_generate_welcome_image_with_logo(self, welcome_image_en):
         """Test welcome image generation."""
-        mock_generate_logo.return_value = MagicMock()
-
-        result = generate_welcome_image_with_logo(Language.ENGLISH)
-
-        mock_generate_logo.assert_called_once()
-        assert result is not None
+        assert welcome_image_en.getvalue().startswith(b"\x89PNG")
@@ -1,364 +1,105 @@
 """Integration tests for complete user flows."""
 
 import pytest
-from unittest.mock import MagicMock, patch, AsyncMock
-from telegram import Update, Message, Chat, User, CallbackQuery
+from unittest.mock import MagicMock, AsyncMock, mock_open
 
+from vechnost_bot import handlers
 from vechnost_bot.handlers import start_command, handle_callback_query
-from vechnost_bot.callback_handlers import CallbackHandlerRegistry
-from vechnost_bot.models import SessionState, Theme, Language, ContentType
-from vechnost_bot.storage import get_session, reset_session
-
-
+from vechnost_bot.callback_handlers import CallbackHandlerRegistry, callback_registry
+from vechnost_bot.models import Theme, Language, ContentType
+
+from tests._fakes import make_callback_query, make_context, make_update
+
+# Any session lookup goes to the per-test memory-backed storage.
+pytestmark = pytest.mark.usefixtures("isolated_storage")
+
+
+# Callback data a user sends, in order, after /start in each flow.
+FLOWS = [
+    pytest.param(
+        ["lang_en", "theme_Acquaintance", "level_1", "cal:Acquaintance:1:q:0", "nav:Acquaintance:1:1"],
+        id="acquaintance",
+    ),
+    pytest.param(
+        ["lang_en", "theme_Sex", "nsfw_confirm", "cal:sex:0:q:0", "toggle:sex:0:t", "cal:sex:0:t:0"],
+        id="sex_theme",
+    ),
+    pytest.param(["lang_en", "reset_game", "reset_confirm"], id="reset"),
+    pytest.param(
+        ["lang_en", "theme_Acquaintance", "level_1", "cal:Acquaintance:1:q:0", "back:calendar", "back:themes"],
+        id="navigation",
+    ),
+    pytest.param(["invalid_callback_data", "unknown_action"], id="error_handling"),
+    pytest.param(["lang_ru", "lang_cs", "lang_en"], id="multilingual"),
+]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _logo_file():
+    """Serve the /start logo from memory for the whole module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(handlers, "open", mock_open(read_data=b""), raising=False)
+        yield
+
+
+@pytest.fixture(scope="session")
+def _flow_update():
+    """One /start update carrying a callback query, shared by every flow."""
+    return make_update(callback_query=make_callback_query())
+
+
+@pytest.fixture
+def mock_update(_flow_update):
+    """The shared update with its awaited methods reset for this test."""
+    for method in (
+        _flow_update.message.reply_text,
+        _flow_update.message.reply_photo,
+        _flow_update.callback_query.answer,
+        _flow_update.callback_query.edit_message_text,
+    ):
+        method.reset_mock(return_value=True, side_effect=True)
+    return _flow_update
+
+
+@pytest.fixture
+def mock_callback_query(mock_update):
+    """The callback query the shared update carries."""
+    return mock_update.callback_query
+
+
+@pytest.fixture
+def mock_context():
+    """Create a mock context object."""
+    return make_context()
+
+
+@pytest.mark.asyncio(loop_scope="session")
 class TestCompleteUserFlows:
     """Test complete user interaction flows."""
 
-    @pytest.fixture
-    def mock_update(self):
-        """Create a mock update object."""
-        update = MagicMock(spec=Update)
-        update.message = MagicMock(spec=Message)
-        update.message.chat = MagicMock(spec=Chat)
-        update.message.chat.id = 12345
-        update.message.from_user = MagicMock(spec=User)
-        update.message.from_user.id = 12345
-        update.message.from_user.username = "testuser"
-        update.message.text = "/start"
-        return update
+    @pytest.fixture(autouse=True)
+    def registry_callback(self, monkeypatch):
+        """Swap the registry's dispatch for an AsyncMock for the whole test."""
+        handle_callback = AsyncMock()
+        monkeypatch.setattr(callback_registry, "handle_callback", handle_callback)
+        return handle_callback
 
     @pytest.fixture
-    def mock_context(self):
-        """Create a mock context object."""
-        context = MagicMock()
-        context.bot = MagicMock()
-        return context
-
-    @pytest.fixture
-    def mock_callback_query(self):
-        """Create a mock callback query."""
-        query = MagicMock(spec=CallbackQuery)
-        query.message = MagicMock(spec=Message)
-        query.message.chat = MagicMock(spec=Chat)
-        query.message.chat.id = 12345
-        query.edit_message_text = AsyncMock()
-        query.answer = AsyncMock()
-        return query
-
-    def setup_method(self):
-        """Clear sessions before each test."""
-        reset_session(12345)
-
-    @pytest.mark.asyncio
-    async def test_complete_acquaintance_flow(self, mock_update, mock_context, mock_callback_query):
-        """Test complete Acquaintance theme flow."""
-        # Step 1: Start command
-        with patch('vechnost_bot.handlers.get_language_selection_keyboard') as mock_keyboard, \
-             patch('vechnost_bot.handlers.detect_language_from_text') as mock_detect, \
-             patch('vechnost_bot.handlers.open') as mock_open, \
-             patch('vechnost_bot.handlers.set_user_context') as mock_set_context:
-
-            mock_detect.return_value = Language.ENGLISH
-            mock_keyboard.return_value = MagicMock()
-            mock_open.return_value.__enter__.return_value = MagicMock()
-            mock_update.message.reply_photo = AsyncMock()
-
-            await start_command(mock_update, mock_context)
-
-            # Verify session was created
-            session = get_session(12345)
-            assert isinstance(session, SessionState)
-
-        # Step 2: Language selection
-        mock_callback_query.data = "lang_en"
-        with patch('vechnost_bot.callback_handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
-
-            mock_update.callback_query = mock_callback_query
-            await handle_callback_query(mock_update, mock_context)
-
-            mock_registry.handle_callback.assert_called_once_with(
-                mock_callback_query, "lang_en"
-            )
-
-        # Step 3: Theme selection
-        mock_callback_query.data = "theme_Acquaintance"
-        with patch('vechnost_bot.callback_handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
-
-            mock_update.callback_query = mock_callback_query
-            await handle_callback_query(mock_update, mock_context)
-
-            mock_registry.handle_callback.assert_called_once_with(
-                mock_callback_query, "theme_Acquaintance"
-            )
-
-        # Step 4: Level selection
-        mock_callback_query.data = "level_1"
-        with patch('vechnost_bot.callback_handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
-
-            mock_update.callback_query = mock_callback_query
-            await handle_callback_query(mock_update, mock_context)
-
-            mock_registry.handle_callback.assert_called_once_with(
-                mock_callback_query, "level_1"
-            )
-
-        # Step 5: Calendar selection
-        mock_callback_query.data = "cal:Acquaintance:1:q:0"
-        with patch('vechnost_bot.callback_handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
-
-            mock_update.callback_query = mock_callback_query
-            await handle_callback_query(mock_update, mock_context)
-
-            mock_registry.handle_callback.assert_called_once_with(
-                mock_callback_query, "cal:Acquaintance:1:q:0"
-            )
-
-        # Step 6: Question navigation
-        mock_callback_query.data = "nav:Acquaintance:1:1"
-        with patch('vechnost_bot.callback_handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
-
-            mock_update.callback_query = mock_callback_query
-            await handle_callback_query(mock_update, mock_context)
-
-            mock_registry.handle_callback.assert_called_once_with(
-                mock_callback_query, "nav:Acquaintance:1:1"
-            )
-
-    @pytest.mark.asyncio
-    async def test_complete_sex_theme_flow(self, mock_update, mock_context, mock_callback_query):
-        """Test complete Sex theme flow with NSFW confirmation."""
-        # Step 1: Start command
-        with patch('vechnost_bot.handlers.get_language_selection_keyboard') as mock_keyboard, \
-             patch('vechnost_bot.handlers.detect_language_from_text') as mock_detect, \
-             patch('vechnost_bot.handlers.open') as mock_open, \
-             patch('vechnost_bot.handlers.set_user_context') as mock_set_context:
-
-            mock_detect.return_value = Language.ENGLISH
-            mock_keyboard.return_value = MagicMock()
-            mock_open.return_value.__enter__.return_value = MagicMock()
-            mock_update.message.reply_photo = AsyncMock()
-
-            await start_command(mock_update, mock_context)
-
-        # Step 2: Language selection
-        mock_callback_query.data = "lang_en"
-        with patch('vechnost_bot.callback_handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
-
-            mock_update.callback_query = mock_callback_query
-            await handle_callback_query(mock_update, mock_context)
-
-        # Step 3: Sex theme selection
-        mock_callback_query.data = "theme_Sex"
-        with patch('vechnost_bot.callback_handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
-
-            mock_update.callback_query = mock_callback_query
-            await handle_callback_query(mock_update, mock_context)
-
-        # Step 4: NSFW confirmation
-        mock_callback_query.data = "nsfw_confirm"
-        with patch('vechnost_bot.callback_handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
-
-            mock_update.callback_query = mock_callback_query
-            await handle_callback_query(mock_update, mock_context)
-
-        # Step 5: Calendar selection (questions)
-        mock_callback_query.data = "cal:sex:0:q:0"
-        with patch('vechnost_bot.callback_handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
-
-            mock_update.callback_query = mock_callback_query
-            await handle_callback_query(mock_update, mock_context)
-
-        # Step 6: Toggle to tasks
-        mock_callback_query.data = "toggle:sex:0:t"
-        with patch('vechnost_bot.callback_handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
-
-            mock_update.callback_query = mock_callback_query
-            await handle_callback_query(mock_update, mock_context)
-
-        # Step 7: Calendar selection (tasks)
-        mock_callback_query.data = "cal:sex:0:t:0"
-        with patch('vechnost_bot.callback_handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
-
-            mock_update.callback_query = mock_callback_query
-            await handle_callback_query(mock_update, mock_context)
-
-    @pytest.mark.asyncio
-    async def test_complete_reset_flow(self, mock_update, mock_context, mock_callback_query):
-        """Test complete reset flow."""
-        # Step 1: Start command
-        with patch('vechnost_bot.handlers.get_language_selection_keyboard') as mock_keyboard, \
-             patch('vechnost_bot.handlers.detect_language_from_text') as mock_detect, \
-             patch('vechnost_bot.handlers.open') as mock_open, \
-             patch('vechnost_bot.handlers.set_user_context') as mock_set_context:
-
-            mock_detect.return_value = Language.ENGLISH
-            mock_keyboard.return_value = MagicMock()
-            mock_open.return_value.__enter__.return_value = MagicMock()
-            mock_update.message.reply_photo = AsyncMock()
-
-            await start_command(mock_update, mock_context)
-
-        # Step 2: Language selection
-        mock_callback_query.data = "lang_en"
-        with patch('vechnost_bot.callback_handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
-
-            mock_update.callback_query = mock_callback_query
-            await handle_callback_query(mock_update, mock_context)
-
-        # Step 3: Reset request
-        mock_callback_query.data = "reset_game"
-        with patch('vechnost_bot.callback_handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
-
-            mock_update.callback_query = mock_callback_query
-            await handle_callback_query(mock_update, mock_context)
-
-        # Step 4: Reset confirmation
-        mock_callback_query.data = "reset_confirm"
-        with patch('vechnost_bot.callback_handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
-
-            mock_update.callback_query = mock_callback_query
-            await handle_callback_query(mock_update, mock_context)
-
-    @pytest.mark.asyncio
-    async def test_complete_navigation_flow(self, mock_update, mock_context, mock_callback_query):
-        """Test complete navigation flow with back buttons."""
-        # Step 1: Start command
-        with patch('vechnost_bot.handlers.get_language_selection_keyboard') as mock_keyboard, \
-             patch('vechnost_bot.handlers.detect_language_from_text') as mock_detect, \
-             patch('vechnost_bot.handlers.open') as mock_open, \
-             patch('vechnost_bot.handlers.set_user_context') as mock_set_context:
-
-            mock_detect.return_value = Language.ENGLISH
-            mock_keyboard.return_value = MagicMock()
-            mock_open.return_value.__enter__.return_value = MagicMock()
-            mock_update.message.reply_photo = AsyncMock()
-
-            await start_command(mock_update, mock_context)
-
-        # Step 2: Language selection
-        mock_callback_query.data = "lang_en"
-        with patch('vechnost_bot.callback_handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
-
-            mock_update.callback_query = mock_callback_query
-            await handle_callback_query(mock_update, mock_context)
-
-        # Step 3: Theme selection
-        mock_callback_query.data = "theme_Acquaintance"
-        with patch('vechnost_bot.callback_handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
-
-            mock_update.callback_query = mock_callback_query
-            await handle_callback_query(mock_update, mock_context)
-
-        # Step 4: Level selection
-        mock_callback_query.data = "level_1"
-        with patch('vechnost_bot.callback_handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
-
-            mock_update.callback_query = mock_callback_query
-            await handle_callback_query(mock_update, mock_context)
-
-        # Step 5: Calendar selection
-        mock_callback_query.data = "cal:Acquaintance:1:q:0"
-        with patch('vechnost_bot.callback_handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
-
-            mock_update.callback_query = mock_callback_query
-            await handle_callback_query(mock_update, mock_context)
-
-        # Step 6: Back to calendar
-        mock_callback_query.data = "back:calendar"
-        with patch('vechnost_bot.callback_handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
-
-            mock_update.callback_query = mock_callback_query
-            await handle_callback_query(mock_update, mock_context)
-
-        # Step 7: Back to themes
-        mock_callback_query.data = "back:themes"
-        with patch('vechnost_bot.callback_handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
-
-            mock_update.callback_query = mock_callback_query
-            await handle_callback_query(mock_update, mock_context)
-
-    @pytest.mark.asyncio
-    async def test_error_handling_flow(self, mock_update, mock_context, mock_callback_query):
-        """Test error handling in user flows."""
-        # Step 1: Start command
-        with patch('vechnost_bot.handlers.get_language_selection_keyboard') as mock_keyboard, \
-             patch('vechnost_bot.handlers.detect_language_from_text') as mock_detect, \
-             patch('vechnost_bot.handlers.open') as mock_open, \
-             patch('vechnost_bot.handlers.set_user_context') as mock_set_context:
-
-            mock_detect.return_value = Language.ENGLISH
-            mock_keyboard.return_value = MagicMock()
-            mock_open.return_value.__enter__.return_value = MagicMock()
-            mock_update.message.reply_photo = AsyncMock()
-
-            await start_command(mock_update, mock_context)
-
-        # Step 2: Invalid callback data
-        mock_callback_query.data = "invalid_callback_data"
-        with patch('vechnost_bot.callback_handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
-
-            mock_update.callback_query = mock_callback_query
-            await handle_callback_query(mock_update, mock_context)
-
-            mock_registry.handle_callback.assert_called_once_with(
-                mock_callback_query, "invalid_callback_data"
-            )
-
-        # Step 3: Unknown callback action
-        mock_callback_query.data = "unknown_action"
-        with patch('vechnost_bot.callback_handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
-
-            mock_update.callback_query = mock_callback_query
-            await handle_callback_query(mock_update, mock_context)
-
-            mock_registry.handle_callback.assert_called_once_with(
-                mock_callback_query, "unknown_action"
-            )
-
-    @pytest.mark.asyncio
-    async def test_multilingual_flow(self, mock_update, mock_context, mock_callback_query):
-        """Test multilingual user flow."""
-        # Test Russian flow
-        mock_callback_query.data = "lang_ru"
-        with patch('vechnost_bot.callback_handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
-
-            mock_update.callback_query = mock_callback_query
-            await handle_callback_query(mock_update, mock_context)
-
-        # Test Czech flow
-        mock_callback_query.data = "lang_cs"
-        with patch('vechnost_bot.callback_handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
-
-            mock_update.callback_query = mock_callback_query
-            await handle_callback_query(mock_update, mock_context)
-
-        # Test English flow
-        mock_callback_query.data = "lang_en"
-        with patch('vechnost_bot.callback_handlers.callback_registry') as mock_registry:
-            mock_registry.handle_callback = AsyncMock()
-
-            mock_update.callback_query = mock_callback_query
-            await handle_callback_query(mock_update, mock_context)
+    async def started_session(self, mock_update, mock_context, monkeypatch):
+        """Run /start with its keyboard and monitoring collaborators stubbed."""
+        monkeypatch.setattr(handlers, "get_language_selection_keyboard", MagicMock())
+        monkeypatch.setattr(handlers, "detect_language_from_text", MagicMock(return_value=Language.ENGLISH))
+        monkeypatch.setattr(handlers, "set_user_context", MagicMock())
+        await start_command(mock_update, mock_context)
+
+    @pytest.mark.parametrize("steps", FLOWS)
+    async def test_flow(self, steps, started_session, mock_update, mock_context, mock_callback_query, registry_callback):
+        """Test a user flow dispatches every callback to the registry in turn."""
+        # Start command sent the language selection
+        mock_update.message.reply_photo.assert_called_once()
+
+        for data in steps:
+            mock_callback_query.data = data
+            await handle_callback_query(mock_update, mock_context)
+            registry_callback.assert_called_once_with(mock_callback_query, data)
+            registry_callback.reset_mock()
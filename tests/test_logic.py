@@ -1,23 +1,38 @@
 """Tests for game logic."""
 
+import pytest
+
 from vechnost_bot.logic import (
     can_draw_card,
     draw_card,
     get_remaining_cards_count,
     is_session_complete,
-    load_game_data,
     validate_session,
 )
 from vechnost_bot.models import ContentType, GameData, SessionState, Theme
 
+# Shared by every test: the logic helpers only read it, and the questions are a
+# tuple so a test cannot change the deck for the others.
+ACQUAINTANCE_GAME_DATA = GameData(themes={
+    Theme.ACQUAINTANCE: {"levels": {1: {"questions": ("q1", "q2", "q3")}}}
+})
+
+
+def _acquaintance_session(drawn: set[str]) -> SessionState:
+    """Acquaintance level-1 questions session with ``drawn`` already drawn."""
+    return SessionState(
+        theme=Theme.ACQUAINTANCE,
+        level=1,
+        content_type=ContentType.QUESTIONS,
+        drawn_cards=drawn,
+    )
+
 
 class TestGameLogic:
     """Test game logic functionality."""
 
-    def test_load_game_data(self):
+    def test_load_game_data(self, game_data):
         """Test loading game data from YAML."""
-        game_data = load_game_data()
-
         assert isinstance(game_data, GameData)
         assert len(game_data.themes) > 0
 
@@ -28,159 +43,104 @@ class TestGameLogic:
 
     def test_validate_session_valid(self):
         """Test validating a valid session."""
-        game_data = GameData(themes={
-            Theme.ACQUAINTANCE: {"levels": {1: {"questions": ["q1", "q2"]}}}
-        })
-
         session = SessionState()
         session.theme = Theme.ACQUAINTANCE
         session.level = 1
         session.content_type = ContentType.QUESTIONS
 
-        assert validate_session(session, game_data) is True
+        assert validate_session(session, ACQUAINTANCE_GAME_DATA) is True
 
     def test_validate_session_invalid_theme(self):
         """Test validating session with invalid theme."""
-        game_data = GameData(themes={
-            Theme.ACQUAINTANCE: {"levels": {1: {"questions": ["q1", "q2"]}}}
-        })
-
         session = SessionState()
         session.theme = Theme.SEX  # Not in game_data
         session.level = 1
         session.content_type = ContentType.QUESTIONS
 
-        assert validate_session(session, game_data) is False
+        assert validate_session(session, ACQUAINTANCE_GAME_DATA) is False
 
     def test_validate_session_invalid_level(self):
         """Test validating session with invalid level."""
-        game_data = GameData(themes={
-            Theme.ACQUAINTANCE: {"levels": {1: {"questions": ["q1", "q2"]}}}
-        })
-
         session = SessionState()
         session.theme = Theme.ACQUAINTANCE
         session.level = 2  # Not in game_data
         session.content_type = ContentType.QUESTIONS
 
-        assert validate_session(session, game_data) is False
+        assert validate_session(session, ACQUAINTANCE_GAME_DATA) is False
 
     def test_validate_session_invalid_content_type(self):
         """Test validating session with invalid content type."""
-        game_data = GameData(themes={
-            Theme.ACQUAINTANCE: {"levels": {1: {"questions": ["q1", "q2"]}}}
-        })
-
         session = SessionState()
         session.theme = Theme.ACQUAINTANCE
         session.level = 1
         session.content_type = ContentType.TASKS  # Not available
 
-        assert validate_session(session, game_data) is False
+        assert validate_session(session, ACQUAINTANCE_GAME_DATA) is False
 
-    def test_get_remaining_cards_count(self):
+    @pytest.mark.parametrize("drawn, expected", [
+        pytest.param(set(), 3, id="none_drawn"),
+        pytest.param({"q1"}, 2, id="one_drawn"),
+        pytest.param({"q1", "q2", "q3"}, 0, id="all_drawn"),
+    ])
+    def test_get_remaining_cards_count(self, drawn, expected):
         """Test getting remaining cards count."""
-        game_data = GameData(themes={
-            Theme.ACQUAINTANCE: {"levels": {1: {"questions": ["q1", "q2", "q3"]}}}
-        })
-
-        session = SessionState()
-        session.theme = Theme.ACQUAINTANCE
-        session.level = 1
-        session.content_type = ContentType.QUESTIONS
-
-        # No cards drawn yet
-        assert get_remaining_cards_count(session, game_data) == 3
-
-        # Draw one card
-        session.drawn_cards.add("q1")
-        assert get_remaining_cards_count(session, game_data) == 2
+        session = _acquaintance_session(drawn)
 
-        # Draw all cards
-        session.drawn_cards.update(["q2", "q3"])
-        assert get_remaining_cards_count(session, game_data) == 0
+        assert get_remaining_cards_count(session, ACQUAINTANCE_GAME_DATA) == expected
 
-    def test_can_draw_card(self):
+    @pytest.mark.parametrize("drawn, expected", [
+        pytest.param(set(), True, id="none_drawn"),
+        pytest.param({"q1", "q2", "q3"}, False, id="all_drawn"),
+    ])
+    def test_can_draw_card(self, drawn, expected):
         """Test checking if card can be drawn."""
-        game_data = GameData(themes={
-            Theme.ACQUAINTANCE: {"levels": {1: {"questions": ["q1", "q2"]}}}
-        })
+        session = _acquaintance_session(drawn)
 
-        session = SessionState()
-        session.theme = Theme.ACQUAINTANCE
-        session.level = 1
-        session.content_type = ContentType.QUESTIONS
-
-        # Can draw initially
-        assert can_draw_card(session, game_data) is True
-
-        # Draw all cards
-        session.drawn_cards.update(["q1", "q2"])
-        assert can_draw_card(session, game_data) is False
+        assert can_draw_card(session, ACQUAINTANCE_GAME_DATA) is expected
 
     def test_draw_card(self):
         """Test drawing a card."""
-        game_data = GameData(themes={
-            Theme.ACQUAINTANCE: {"levels": {1: {"questions": ["q1", "q2", "q3"]}}}
-        })
-
         session = SessionState()
         session.theme = Theme.ACQUAINTANCE
         session.level = 1
         session.content_type = ContentType.QUESTIONS
 
         # Draw first card
-        card = draw_card(session, game_data)
+        card = draw_card(session, ACQUAINTANCE_GAME_DATA)
         assert card in ["q1", "q2", "q3"]
         assert card in session.drawn_cards
         assert len(session.drawn_cards) == 1
 
         # Draw second card
-        card2 = draw_card(session, game_data)
+        card2 = draw_card(session, ACQUAINTANCE_GAME_DATA)
         assert card2 != card
         assert card2 in session.drawn_cards
         assert len(session.drawn_cards) == 2
 
     def test_draw_card_no_cards_available(self):
         """Test drawing when no cards available."""
-        game_data = GameData(themes={
-            Theme.ACQUAINTANCE: {"levels": {1: {"questions": ["q1", "q2"]}}}
-        })
-
         session = SessionState()
         session.theme = Theme.ACQUAINTANCE
         session.level = 1
         session.content_type = ContentType.QUESTIONS
-        session.drawn_cards.update(["q1", "q2"])
+        session.drawn_cards.update(["q1", "q2", "q3"])
 
-        card = draw_card(session, game_data)
+        card = draw_card(session, ACQUAINTANCE_GAME_DATA)
         assert card is None
 
     def test_draw_card_invalid_session(self):
         """Test drawing with invalid session."""
-        game_data = GameData(themes={
-            Theme.ACQUAINTANCE: {"levels": {1: {"questions": ["q1", "q2"]}}}
-        })
-
         session = SessionState()  # No theme/level set
 
-        card = draw_card(session, game_data)
+        card = draw_card(session, ACQUAINTANCE_GAME_DATA)
         assert card is None
 
-    def test_is_session_complete(self):
+    @pytest.mark.parametrize("drawn, expected", [
+        pytest.param(set(), False, id="none_drawn"),
+        pytest.param({"q1", "q2", "q3"}, True, id="all_drawn"),
+    ])
+    def test_is_session_complete(self, drawn, expected):
         """Test checking if session is complete."""
-        game_data = GameData(themes={
-            Theme.ACQUAINTANCE: {"levels": {1: {"questions": ["q1", "q2"]}}}
-        })
-
-        session = SessionState()
-        session.theme = Theme.ACQUAINTANCE
-        session.level = 1
-        session.content_type = ContentType.QUESTIONS
-
-        # Not complete initially
-        assert is_session_complete(session, game_data) is False
+        session = _acquaintance_session(drawn)
 
-        # Complete after drawing all cards
-        session.drawn_cards.update(["q1", "q2"])
-        assert is_session_complete(session, game_data) is True
+        assert is_session_complete(session, ACQUAINTANCE_GAME_DATA) is expected
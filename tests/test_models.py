@@ -1,7 +1,21 @@
 """Tests for data models."""
 
+import pytest
+
 from vechnost_bot.models import ContentType, GameData, SessionState, Theme
 
+# Acquaintance has three question-only levels; Sex has questions and tasks.
+SAMPLE_GAME_DATA = GameData(themes={
+    Theme.ACQUAINTANCE: {
+        "levels": {
+            1: {"questions": ["q1"]},
+            2: {"questions": ["q2"]},
+            3: {"questions": ["q3"]},
+        }
+    },
+    Theme.SEX: {"levels": {1: {"questions": ["q1", "q2"], "tasks": ["t1", "t2"]}}},
+})
+
 
 class TestSessionState:
     """Test SessionState model."""
@@ -38,86 +52,39 @@ class TestGameData:
 
     def test_empty_game_data(self):
         """Test empty game data."""
-        game_data = GameData()
-        assert game_data.themes == {}
-        assert game_data.get_available_themes() == []
-
-    def test_get_available_themes(self):
-        """Test getting available themes."""
-        game_data = GameData(themes={
-            Theme.ACQUAINTANCE: {"levels": {1: {"questions": ["q1"]}}},
-            Theme.SEX: {"levels": {1: {"questions": ["q2"], "tasks": ["t1"]}}},
-        })
-
-        themes = game_data.get_available_themes()
-        assert Theme.ACQUAINTANCE in themes
-        assert Theme.SEX in themes
-        assert len(themes) == 2
-
-    def test_get_available_levels(self):
-        """Test getting available levels for a theme."""
-        game_data = GameData(themes={
-            Theme.ACQUAINTANCE: {
-                "levels": {
-                    1: {"questions": ["q1"]},
-                    2: {"questions": ["q2"]},
-                    3: {"questions": ["q3"]},
-                }
-            }
-        })
-
-        levels = game_data.get_available_levels(Theme.ACQUAINTANCE)
-        assert levels == [1, 2, 3]
-
-        # Test non-existent theme
-        levels = game_data.get_available_levels(Theme.PROVOCATION)
-        assert levels == []
-
-    def test_get_content(self):
-        """Test getting content for theme/level/type."""
-        game_data = GameData(themes={
-            Theme.SEX: {
-                "levels": {
-                    1: {
-                        "questions": ["q1", "q2"],
-                        "tasks": ["t1", "t2"]
-                    }
-                }
-            }
-        })
-
-        questions = game_data.get_content(Theme.SEX, 1, ContentType.QUESTIONS)
-        assert questions == ["q1", "q2"]
-
-        tasks = game_data.get_content(Theme.SEX, 1, ContentType.TASKS)
-        assert tasks == ["t1", "t2"]
-
-        # Test non-existent content
-        questions = game_data.get_content(Theme.ACQUAINTANCE, 1, ContentType.QUESTIONS)
-        assert questions == []
-
-    def test_get_available_content_types(self):
-        """Test getting available content types."""
-        game_data = GameData(themes={
-            Theme.ACQUAINTANCE: {"levels": {1: {"questions": ["q1"]}}},
-            Theme.SEX: {"levels": {1: {"questions": ["q1"], "tasks": ["t1"]}}},
-        })
-
-        # Theme with only questions
-        types = game_data.get_available_content_types(Theme.ACQUAINTANCE, 1)
-        assert types == [ContentType.QUESTIONS]
-
-        # Theme with both questions and tasks
-        types = game_data.get_available_content_types(Theme.SEX, 1)
-        assert ContentType.QUESTIONS in types
-        assert ContentType.TASKS in types
-        assert len(types) == 2
-
-    def test_has_nsfw_content(self):
-        """Test NSFW content detection."""
-        game_data = GameData()
-
-        assert game_data.has_nsfw_content(Theme.SEX) is True
-        assert game_data.has_nsfw_content(Theme.ACQUAINTANCE) is False
-        assert game_data.has_nsfw_content(Theme.FOR_COUPLES) is False
-        assert game_data.has_nsfw_content(Theme.PROVOCATION) is False
+        assert GameData().themes == {}
+
+    @pytest.mark.parametrize("game_data, method, args, expected", [
+        pytest.param(GameData(), "get_available_themes", (), [], id="themes_empty"),
+        pytest.param(
+            SAMPLE_GAME_DATA, "get_available_themes", (), [Theme.ACQUAINTANCE, Theme.SEX], id="themes",
+        ),
+        pytest.param(SAMPLE_GAME_DATA, "get_available_levels", (Theme.ACQUAINTANCE,), [1, 2, 3], id="levels"),
+        pytest.param(SAMPLE_GAME_DATA, "get_available_levels", (Theme.PROVOCATION,), [], id="levels_missing_theme"),
+        pytest.param(
+            SAMPLE_GAME_DATA, "get_content", (Theme.SEX, 1, ContentType.QUESTIONS), ["q1", "q2"],
+            id="content_questions",
+        ),
+        pytest.param(
+            SAMPLE_GAME_DATA, "get_content", (Theme.SEX, 1, ContentType.TASKS), ["t1", "t2"], id="content_tasks",
+        ),
+        pytest.param(
+            SAMPLE_GAME_DATA, "get_content", (Theme.PROVOCATION, 1, ContentType.QUESTIONS), [],
+            id="content_missing_theme",
+        ),
+        pytest.param(
+            SAMPLE_GAME_DATA, "get_available_content_types", (Theme.ACQUAINTANCE, 1), [ContentType.QUESTIONS],
+            id="content_types_questions_only",
+        ),
+        pytest.param(
+            SAMPLE_GAME_DATA, "get_available_content_types", (Theme.SEX, 1),
+            [ContentType.QUESTIONS, ContentType.TASKS], id="content_types_both",
+        ),
+        pytest.param(GameData(), "has_nsfw_content", (Theme.SEX,), True, id="nsfw_sex"),
+        pytest.param(GameData(), "has_nsfw_content", (Theme.ACQUAINTANCE,), False, id="nsfw_acquaintance"),
+        pytest.param(GameData(), "has_nsfw_content", (Theme.FOR_COUPLES,), False, id="nsfw_for_couples"),
+        pytest.param(GameData(), "has_nsfw_content", (Theme.PROVOCATION,), False, id="nsfw_provocation"),
+    ])
+    def test_game_data_queries(self, game_data, method, args, expected):
+        """Test each GameData query against a known table of themes."""
+        assert getattr(game_data, method)(*args) == expected
@@ -2,7 +2,6 @@
 
 import os
 import pytest
-import time
 from unittest.mock import MagicMock, patch
 
 from vechnost_bot.monitoring import (
@@ -60,7 +59,6 @@ class TestTrackPerformance:
         """Test tracking performance of successful sync function."""
         @track_performance("test_operation")
         def test_func():
-            time.sleep(0.01)
             return "success"
 
         result = test_func()
@@ -71,7 +69,6 @@ class TestTrackPerformance:
         """Test tracking performance of sync function that raises error."""
         @track_performance("test_operation")
         def test_func():
-            time.sleep(0.01)
             raise ValueError("Test error")
 
         with pytest.raises(ValueError):
@@ -82,7 +79,7 @@ class TestTrackPerformance:
         """Test tracking performance of successful async function."""
         @track_performance("test_operation")
         async def test_func():
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
             return "success"
 
         result = await test_func()
@@ -94,7 +91,7 @@ class TestTrackPerformance:
         """Test tracking performance of async function that raises error."""
         @track_performance("test_operation")
         async def test_func():
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
             raise ValueError("Test error")
 
         with pytest.raises(ValueError):
@@ -152,14 +149,14 @@ class TestTrackOperation:
     async def test_successful_operation(self):
         """Test tracking successful operation."""
         async with track_operation("test_operation", user_id=123):
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
 
     @pytest.mark.asyncio
     async def test_failed_operation(self):
         """Test tracking failed operation."""
         with pytest.raises(ValueError):
             async with track_operation("test_operation", user_id=123):
-                await asyncio.sleep(0.01)
+                await asyncio.sleep(0)
                 raise ValueError("Test error")
 
 
@@ -513,7 +513,7 @@ class TestPerformanceMonitoring:
         @track_performance("test_operation")
         async def test_operation():
             """Test operation."""
-            await asyncio.sleep(0.01)  # 10ms operation
+            await asyncio.sleep(0)
             return "success"
 
         # Execute operation
@@ -551,7 +551,7 @@ class TestPerformanceMonitoring:
         from vechnost_bot.monitoring import track_operation
 
         async with track_operation("test_operation", user_id=12345, theme="acquaintance"):
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
 
         # Verify context was set
         mock_sentry.set_tag.assert_called()
@@ -863,22 +863,23 @@ class SimpleActionHandler(CallbackHandler):
 
     async def handle(self, query: Any, callback_data: SimpleCallbackData, session: SessionState) -> None:
         """Handle simple actions."""
-        if callback_data.action == CallbackAction.NSFW_CONFIRM:
-            await self._handle_nsfw_confirmation(query, session)
-        elif callback_data.action == CallbackAction.NSFW_DENY:
-            await self._handle_nsfw_denial(query, session)
-        elif callback_data.action == CallbackAction.RESET_GAME:
-            await self._handle_reset_request(query, session)
-        elif callback_data.action == CallbackAction.RESET_CONFIRM:
-            await self._handle_reset_confirmation(query, session)
-        elif callback_data.action == CallbackAction.RESET_CANCEL:
-            await self._handle_reset_cancel(query, session)
-        elif callback_data.action == CallbackAction.NOOP:
-            # No operation - do nothing
-            pass
-        else:
-            logger.warning(f"Unknown simple action: {callback_data.action}")
-            await query.edit_message_text(get_text('errors.unknown_callback', session.language))
+        match callback_data.action:
+            case CallbackAction.NSFW_CONFIRM:
+                await self._handle_nsfw_confirmation(query, session)
+            case CallbackAction.NSFW_DENY:
+                await self._handle_nsfw_denial(query, session)
+            case CallbackAction.RESET_GAME:
+                await self._handle_reset_request(query, session)
+            case CallbackAction.RESET_CONFIRM:
+                await self._handle_reset_confirmation(query, session)
+            case CallbackAction.RESET_CANCEL:
+                await self._handle_reset_cancel(query, session)
+            case CallbackAction.NOOP:
+                # No operation - do nothing
+                pass
+            case _:
+                logger.warning(f"Unknown simple action: {callback_data.action}")
+                await query.edit_message_text(get_text('errors.unknown_callback', session.language))
 
     async def _handle_nsfw_confirmation(self, query: Any, session: SessionState) -> None:
         """Handle NSFW content confirmation."""
@@ -1,9 +1,18 @@
-"""Pydantic models for callback data validation and parsing."""
+"""Callback data models and parsing."""
 
+import string
+import sys
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
 
-from pydantic import BaseModel, Field, field_validator
+# Every character the bot puts into callback_data; anything else is rejected
+_ALLOWED_CHARS = frozenset(string.ascii_letters + string.digits + "_:- ")
+
+# Topic and category codes come from small closed sets; parsed fields reuse
+# these interned strings instead of the fresh slices produced by split()
+_TOPICS = {code: sys.intern(code) for code in ("acq", "couples", "sex", "prov")}
+_CATEGORIES = {code: sys.intern(code) for code in ("q", "t")}
 
 
 class CallbackAction(str, Enum):
@@ -34,55 +43,29 @@ class CallbackAction(str, Enum):
     SHOW_GIFT = "show_gift"
 
 
-class CallbackData(BaseModel):
-    """Base model for callback data validation."""
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CallbackData:
+    """Base model for callback data validation.
+
+    Plain frozen dataclasses: every field is checked by the ``parse``
+    constructors, so per-instance validation would only repeat that work.
+    """
 
     action: CallbackAction
-    raw_data: str = Field(..., description="Original callback data string")
+    raw_data: str  # Original callback data string
 
     @classmethod
     def parse(cls, data: str) -> "CallbackData":
         """Parse callback data string into structured data."""
-        if not data or len(data) > 100:  # Reasonable limit
-            raise ValueError(f"Invalid callback data: {data}")
-
-        # Check for malicious patterns
-        dangerous_patterns = ['..', '/', '\\', 'script', 'javascript']
-        if any(pattern in data.lower() for pattern in dangerous_patterns):
-            raise ValueError(f"Potentially malicious callback data: {data}")
-
-        # Parse based on action prefix
-        if data.startswith("theme_"):
-            return ThemeCallbackData.parse(data)
-        elif data.startswith("level_"):
-            return LevelCallbackData.parse(data)
-        elif data.startswith("cal:"):
-            return CalendarCallbackData.parse(data)
-        elif data.startswith("q:"):
-            return QuestionCallbackData.parse(data)
-        elif data.startswith("nav:"):
-            return NavigationCallbackData.parse(data)
-        elif data.startswith("toggle:"):
-            return ToggleCallbackData.parse(data)
-        elif data.startswith("back:"):
-            return BackCallbackData.parse(data)
-        elif data.startswith("lang_confirm_"):
-            return LanguageConfirmCallbackData.parse(data)
-        elif data.startswith("lang_"):
-            return LanguageCallbackData.parse(data)
-        elif data == "lang_back":
-            return LanguageBackCallbackData.parse(data)
-        elif data in ["nsfw_confirm", "nsfw_deny", "reset_game", "reset_confirm", "reset_cancel", "noop", "check_payment", "start_game", "show_inside", "show_why", "daily_off", "daily_on", "show_gift"]:
-            return SimpleCallbackData.parse(data)
-        else:
-            raise ValueError(f"Unknown callback action: {data}")
+        return _parse(data)
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
 class ThemeCallbackData(CallbackData):
     """Callback data for theme selection."""
 
     action: CallbackAction = CallbackAction.THEME
-    theme_name: str = Field(..., description="Theme name")
+    theme_name: str  # Theme name
 
     @classmethod
     def parse(cls, data: str) -> "ThemeCallbackData":
@@ -90,18 +73,19 @@ class ThemeCallbackData(CallbackData):
         if not data.startswith("theme_"):
             raise ValueError(f"Invalid theme callback data: {data}")
 
-        theme_name = data.replace("theme_", "")
+        theme_name = data[6:]  # Remove "theme_" prefix
         if not theme_name:
             raise ValueError("Empty theme name")
 
         return cls(raw_data=data, theme_name=theme_name)
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
 class LevelCallbackData(CallbackData):
     """Callback data for level selection."""
 
     action: CallbackAction = CallbackAction.LEVEL
-    level: int = Field(..., description="Level number")
+    level: int  # Level number
 
     @classmethod
     def parse(cls, data: str) -> "LevelCallbackData":
@@ -109,7 +93,7 @@ class LevelCallbackData(CallbackData):
         if not data.startswith("level_"):
             raise ValueError(f"Invalid level callback data: {data}")
 
-        level_str = data.replace("level_", "")
+        level_str = data[6:]  # Remove "level_" prefix
         try:
             level = int(level_str)
         except ValueError:
@@ -121,14 +105,15 @@ class LevelCallbackData(CallbackData):
         return cls(raw_data=data, level=level)
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
 class CalendarCallbackData(CallbackData):
     """Callback data for calendar navigation."""
 
     action: CallbackAction = CallbackAction.CALENDAR
-    topic: str = Field(..., description="Topic code")
-    level_or_0: int = Field(..., description="Level number or 0")
-    category: str = Field(..., description="Category (q or t)")
-    page: int = Field(..., description="Page number")
+    topic: str  # Topic code
+    level_or_0: int  # Level number or 0
+    category: str  # Category (q or t)
+    page: int  # Page number
 
     @classmethod
     def parse(cls, data: str) -> "CalendarCallbackData":
@@ -140,16 +125,16 @@ class CalendarCallbackData(CallbackData):
         if len(parts) != 5:
             raise ValueError(f"Invalid calendar callback format: {data}")
 
-        topic = parts[1]
+        topic = _TOPICS.get(parts[1], parts[1])
         try:
             level_or_0 = int(parts[2])
             page = int(parts[4])
         except ValueError as e:
             raise ValueError(f"Invalid numeric values in calendar callback: {e}")
 
-        category = parts[3]
-        if category not in ["q", "t"]:
-            raise ValueError(f"Invalid category: {category}")
+        category = _CATEGORIES.get(parts[3])
+        if category is None:
+            raise ValueError(f"Invalid category: {parts[3]}")
 
         if level_or_0 < 0 or level_or_0 > 10:
             raise ValueError(f"Level out of range: {level_or_0}")
@@ -166,13 +151,14 @@ class CalendarCallbackData(CallbackData):
         )
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
 class QuestionCallbackData(CallbackData):
     """Callback data for question selection."""
 
     action: CallbackAction = CallbackAction.QUESTION
-    topic: str = Field(..., description="Topic code")
-    level_or_0: int = Field(..., description="Level number or 0")
-    index: int = Field(..., description="Question index")
+    topic: str  # Topic code
+    level_or_0: int  # Level number or 0
+    index: int  # Question index
 
     @classmethod
     def parse(cls, data: str) -> "QuestionCallbackData":
@@ -184,7 +170,7 @@ class QuestionCallbackData(CallbackData):
         if len(parts) != 4:
             raise ValueError(f"Invalid question callback format: {data}")
 
-        topic = parts[1]
+        topic = _TOPICS.get(parts[1], parts[1])
         try:
             level_or_0 = int(parts[2])
             index = int(parts[3])
@@ -205,13 +191,14 @@ class QuestionCallbackData(CallbackData):
         )
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
 class NavigationCallbackData(CallbackData):
     """Callback data for question navigation."""
 
     action: CallbackAction = CallbackAction.NAVIGATION
-    topic: str = Field(..., description="Topic code")
-    level_or_0: int = Field(..., description="Level number or 0")
-    index: int = Field(..., description="Question index")
+    topic: str  # Topic code
+    level_or_0: int  # Level number or 0
+    index: int  # Question index
 
     @classmethod
     def parse(cls, data: str) -> "NavigationCallbackData":
@@ -223,7 +210,7 @@ class NavigationCallbackData(CallbackData):
         if len(parts) != 4:
             raise ValueError(f"Invalid navigation callback format: {data}")
 
-        topic = parts[1]
+        topic = _TOPICS.get(parts[1], parts[1])
         try:
             level_or_0 = int(parts[2])
             index = int(parts[3])
@@ -244,13 +231,14 @@ class NavigationCallbackData(CallbackData):
         )
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
 class ToggleCallbackData(CallbackData):
     """Callback data for content type toggle."""
 
     action: CallbackAction = CallbackAction.TOGGLE
-    topic: str = Field(..., description="Topic code")
-    category: str = Field(..., description="Category (q or t)")
-    page: int = Field(..., description="Page number")
+    topic: str  # Topic code
+    category: str  # Category (q or t)
+    page: int  # Page number
 
     @classmethod
     def parse(cls, data: str) -> "ToggleCallbackData":
@@ -262,12 +250,15 @@ class ToggleCallbackData(CallbackData):
         if len(parts) != 4:
             raise ValueError(f"Invalid toggle callback format: {data}")
 
-        topic = parts[1]
-        page = int(parts[2])
-        category = parts[3]
+        topic = _TOPICS.get(parts[1], parts[1])
+        try:
+            page = int(parts[2])
+        except ValueError as e:
+            raise ValueError(f"Invalid numeric values in toggle callback: {e}")
 
-        if category not in ["q", "t"]:
-            raise ValueError(f"Invalid category: {category}")
+        category = _CATEGORIES.get(parts[3])
+        if category is None:
+            raise ValueError(f"Invalid category: {parts[3]}")
 
         if page < 0:
             raise ValueError(f"Page out of range: {page}")
@@ -280,11 +271,12 @@ class ToggleCallbackData(CallbackData):
         )
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
 class BackCallbackData(CallbackData):
     """Callback data for back navigation."""
 
     action: CallbackAction = CallbackAction.BACK
-    destination: str = Field(..., description="Back destination")
+    destination: str  # Back destination
 
     @classmethod
     def parse(cls, data: str) -> "BackCallbackData":
@@ -303,10 +295,11 @@ class BackCallbackData(CallbackData):
         return cls(raw_data=data, destination=destination)
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
 class SimpleCallbackData(CallbackData):
     """Callback data for simple actions."""
 
-    action: CallbackAction = Field(..., description="Action type")
+    action: CallbackAction  # Action type
 
     @classmethod
     def parse(cls, data: str) -> "SimpleCallbackData":
@@ -319,6 +312,7 @@ class SimpleCallbackData(CallbackData):
         return cls(raw_data=data, action=action)
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
 class LanguageCallbackData(CallbackData):
     """Callback data for language selection."""
 
@@ -338,6 +332,7 @@ class LanguageCallbackData(CallbackData):
         return cls(raw_data=data, language_code=language_code)
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
 class LanguageConfirmCallbackData(CallbackData):
     """Callback data for language confirmation."""
 
@@ -357,6 +352,7 @@ class LanguageConfirmCallbackData(CallbackData):
         return cls(raw_data=data, language_code=language_code)
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
 class LanguageBackCallbackData(CallbackData):
     """Callback data for language selection back navigation."""
 
@@ -369,3 +365,64 @@ class LanguageBackCallbackData(CallbackData):
             raise ValueError(f"Invalid language back callback data: {data}")
 
         return cls(raw_data=data)
+
+
+def _parse_language(data: str) -> CallbackData:
+    """Parse ``lang_<code>`` and ``lang_confirm_<code>`` callback data."""
+    if data.startswith("lang_confirm_"):
+        return LanguageConfirmCallbackData.parse(data)
+    return LanguageCallbackData.parse(data)
+
+
+_SIMPLE_ACTIONS = (
+    "nsfw_confirm", "nsfw_deny", "reset_game", "reset_confirm", "reset_cancel", "noop",
+    "check_payment", "start_game", "show_inside", "show_why", "daily_off", "daily_on", "show_gift",
+)
+
+# Prefix dispatch tables for _parse
+_EXACT_PARSERS = {
+    **dict.fromkeys(_SIMPLE_ACTIONS, SimpleCallbackData.parse),
+    "lang_back": LanguageBackCallbackData.parse,
+}
+_COLON_PARSERS = {
+    "cal": CalendarCallbackData.parse,
+    "q": QuestionCallbackData.parse,
+    "nav": NavigationCallbackData.parse,
+    "toggle": ToggleCallbackData.parse,
+    "back": BackCallbackData.parse,
+}
+_UNDERSCORE_PARSERS = {
+    "theme": ThemeCallbackData.parse,
+    "level": LevelCallbackData.parse,
+    "lang": _parse_language,
+}
+
+
+@lru_cache(maxsize=4096)
+def _parse(data: str) -> CallbackData:
+    """Route callback data to the parser for its action.
+
+    Results are cached per string: the same buttons are pressed over and
+    over, and the models are frozen, so one instance can be shared.
+    """
+    if not data or len(data) > 100:  # Reasonable limit
+        raise ValueError(f"Invalid callback data: {data}")
+
+    # Path separators and dots fall outside the allowed set; "script" is the
+    # one letters-only pattern still worth refusing
+    if not _ALLOWED_CHARS.issuperset(data) or "script" in data.lower():
+        raise ValueError(f"Potentially malicious callback data: {data}")
+
+    # Route on the literal prefix: whole-string actions first, then the
+    # token before the first ":" or "_".
+    parser = _EXACT_PARSERS.get(data)
+    if parser is None:
+        head, sep, _ = data.partition(":")
+        parser = _COLON_PARSERS.get(head) if sep else None
+    if parser is None:
+        head, sep, _ = data.partition("_")
+        parser = _UNDERSCORE_PARSERS.get(head) if sep else None
+    if parser is None:
+        raise ValueError(f"Unknown callback action: {data}")
+
+    return parser(data)
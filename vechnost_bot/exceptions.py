@@ -1,5 +1,6 @@
 """Custom exception hierarchy for Vechnost bot."""
 
+from types import MappingProxyType
 from typing import Optional, Dict, Any
 
 
@@ -306,7 +307,7 @@ class ErrorCodes:
 
 
 # User-friendly error messages
-USER_ERROR_MESSAGES = {
+USER_ERROR_MESSAGES = MappingProxyType({
     ErrorCodes.INVALID_THEME: "❌ Неверная тема",
     ErrorCodes.INVALID_LEVEL: "❌ Неверный уровень",
     ErrorCodes.INVALID_LANGUAGE: "❌ Неверный язык",
@@ -334,7 +335,7 @@ USER_ERROR_MESSAGES = {
     ErrorCodes.FILE_NOT_FOUND: "❌ Файл не найден",
     ErrorCodes.FILE_READ_FAILED: "❌ Ошибка чтения файла",
     ErrorCodes.FILE_WRITE_FAILED: "❌ Ошибка записи файла",
-}
+})
 
 
 def get_user_error_message(error_code: str, language: str = "ru") -> str:
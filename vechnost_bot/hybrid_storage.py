@@ -90,6 +90,14 @@ class InMemoryStorage:
         """Memory storage is always healthy."""
         return True
 
+    def clear(self) -> None:
+        """Drop everything held in memory."""
+        self.sessions.clear()
+        self.user_stats.clear()
+        self.image_cache.clear()
+        self.counters.clear()
+        self.rate_limits.clear()
+
 
 class HybridStorage:
     """Hybrid storage with Redis auto-start and fallback to in-memory."""
@@ -1,7 +1,7 @@
 """Repository layer for database operations."""
 
 import logging
-from datetime import datetime
+from datetime import UTC, datetime
 
 from sqlalchemy import delete, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -21,6 +21,11 @@ from .models import (
 logger = logging.getLogger(__name__)
 
 
+def _now_utc() -> datetime:
+    """Current UTC time as a naive datetime, matching the naive timestamp columns."""
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
 class UserRepository:
     """Repository for User operations."""
 
@@ -130,7 +135,7 @@ class ProductRepository:
             product.stars_amount = stars_amount
             product.t_link = t_link
             product.web_link = web_link
-            product.updated_at = datetime.utcnow()
+            product.updated_at = _now_utc()
             logger.info(f"Updated product: {product_id}")
         else:
             # Create new product
@@ -203,7 +208,7 @@ class PaymentRepository:
         session: AsyncSession, telegram_user_id: int
     ) -> list[Payment]:
         """Get active (non-expired) payments for user."""
-        now = datetime.utcnow()
+        now = _now_utc()
         result = await session.execute(
             select(Payment)
             .where(Payment.telegram_user_id == telegram_user_id)
@@ -245,7 +250,7 @@ class SubscriptionRepository:
         )
 
         if last_event_at is None:
-            last_event_at = datetime.utcnow()
+            last_event_at = _now_utc()
 
         if subscription:
             # Update existing subscription
@@ -279,7 +284,7 @@ class SubscriptionRepository:
         session: AsyncSession, user_id: int
     ) -> list[Subscription]:
         """Get active subscriptions for user (including lifetime subscriptions)."""
-        now = datetime.utcnow()
+        now = _now_utc()
         result = await session.execute(
             select(Subscription)
             .where(Subscription.user_id == user_id)
@@ -377,7 +382,7 @@ class CertificateRepository:
         """Mark certificate as used by a user."""
         certificate.is_used = True
         certificate.used_by_telegram_user_id = telegram_user_id
-        certificate.used_at = datetime.utcnow()
+        certificate.used_at = _now_utc()
         await session.flush()
         logger.info(
             f"Marked certificate {certificate.code} as used by user {telegram_user_id}"